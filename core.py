@@ -2,46 +2,240 @@
 core.py — Utilitaires partagés pour tous les jeux.
 """
 
-import urllib.request
+import hashlib
+import json
+import os
+import re
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing, contextmanager
 from datetime import date
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 
-import cloudscraper
+try:
+    import orjson
+except ImportError:  # CI : dépendances minimales (voir .github/workflows/daily.yml)
+    orjson = None
 
 # ── Configuration globale ─────────────────────────────────────────────────────
 
 SITE_URL = "https://solution-du-jour.fr"
 DOCS_DIR = Path("docs")
 
-MONTHS_FR = [
+MONTHS_FR = (
     "", "janvier", "février", "mars", "avril", "mai", "juin",
     "juillet", "août", "septembre", "octobre", "novembre", "décembre",
-]
+)
 
-DAYS_FR = [
+DAYS_FR = (
     "lundi", "mardi", "mercredi", "jeudi", "vendredi", "samedi", "dimanche",
-]
+)
 
-# Session cloudscraper partagée (gère les défis Cloudflare JS)
-_session = cloudscraper.create_scraper()
+# Cache des archives JSON déjà parsées (voir load_all_archives)
+ARCHIVE_INDEX_NAME = ".index.json"
+
+# Empreintes des pages d'archive déjà générées (voir page_key)
+PAGE_MANIFEST_NAME = ".manifest.json"
+
+# Liste des dates d'archive, rangée à côté du dossier archive (voir archive_dates)
+ARCHIVE_DATES_NAME = ".archive-dates.json"
+
+# Nom d'un fichier d'archive 'YYYY-MM-DD.json' (regex compilée une seule fois)
+_ARCHIVE_RE = re.compile(r"\d{4}-\d{2}-\d{2}\.json").fullmatch
+
+# Threads utilisés pour charger les archives JSON (I/O bound)
+_ARCHIVE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+# Fichiers lus par lot quand les archives sont parcourues en flux
+_ARCHIVE_BATCH = 64
+
+# Session cloudscraper partagée (gère les défis Cloudflare JS), créée au
+# premier appel de get_session() : inutile pour les scripts hors-ligne
+_session = None
+_session_lock = threading.Lock()
+# Dossiers écrits pendant un fsync_barrier() actif (None hors barrière)
+_barrier_dirs: set[Path] | None = None
 
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
+def get_session():
+    """Retourne la session cloudscraper partagée (créée à la demande)."""
+    global _session
+    if _session is None:
+        with _session_lock:  # generate.py lance Cémantix et Sutom en parallèle
+            if _session is None:
+                import cloudscraper
+                from urllib3.util.retry import Retry
+                session = cloudscraper.create_scraper()
+                # Réessais sur erreurs transitoires, sur la même connexion keep-alive.
+                # GET/HEAD uniquement (défaut de Retry) : les POST /score et /nearby
+                # ne sont jamais rejoués. On garde les adaptateurs de cloudscraper
+                # (suite TLS spécifique) et on ne change que leur politique de réessai.
+                retry = Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=(429, 502, 503, 504), raise_on_status=False)
+                for adapter in session.adapters.values():
+                    adapter.max_retries = retry
+                _session = session
+    return _session
+
+
+def json_loads(raw: bytes | str):
+    """Décode du JSON via orjson si disponible (sinon json stdlib)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def json_dumps_pretty(obj) -> bytes:
+    """Sérialise en JSON indenté (2 espaces, UTF-8 brut) via orjson si disponible.
+    Même mise en forme que json.dumps(obj, ensure_ascii=False, indent=2), mais
+    pas forcément les mêmes octets : orjson écrit 1e-7 (1e-07) et null pour NaN.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+@lru_cache(maxsize=4096)  # mêmes dates formatées plusieurs fois par génération
 def date_fr(d: date) -> str:
     """Retourne une date en français : 'samedi 28 février 2026'."""
-    return f"{DAYS_FR[d.weekday()]} {d.day} {MONTHS_FR[d.month]} {d.year}"
+    return "%s %d %s %d" % (DAYS_FR[d.weekday()], d.day, MONTHS_FR[d.month], d.year)
 
 
-def atomic_write(path: Path, content: str) -> None:
-    """Écriture atomique : écrit dans .tmp puis renomme."""
+def atomic_write(path: Path, content: str | bytes, fsync: bool = True) -> None:
+    """Écriture atomique : écrit dans .tmp, fsync, puis renomme.
+    content : texte (encodé en UTF-8) ou bytes déjà encodés (ex. orjson.dumps).
+    fsync=False : pas de fsync par fichier (boucles de régénération) ; appeler
+    sync_dir() sur le dossier une fois le lot terminé.
+    Dans un bloc fsync_barrier(), le fsync est reporté à la sortie du bloc.
+    """
+    atomic_write_iter(path, (content,), fsync)
+
+
+def atomic_write_iter(path: Path, chunks: Iterable[str | bytes], fsync: bool = True) -> None:
+    """Comme atomic_write, mais écrit les fragments au fur et à mesure qu'ils
+    sont produits (pas de chaîne complète en mémoire).
+    Si le fichier existe déjà avec un contenu identique, rien n'est écrit
+    (ni .tmp, ni fsync, ni renommage) : le fichier et son mtime sont conservés.
+    """
+    try:
+        old = path.read_bytes()
+    except OSError:
+        old = None
     tmp = path.with_suffix(path.suffix + ".tmp")
-    tmp.write_text(content, encoding="utf-8")
-    tmp.replace(path)
+    pending = []  # fragments identiques au fichier existant, pas encore écrits
+    pos = 0
+    fd = -1
+    try:
+        for chunk in chunks:
+            data = chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+            if fd < 0:
+                if old is not None and old.startswith(data, pos):
+                    pending.append(data)
+                    pos += len(data)
+                    continue
+                fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                pending.append(data)
+                _writev_all(fd, pending)  # préfixe identique + 1er fragment : un seul appel
+                continue
+            _write_all(fd, data)
+        if fd < 0:
+            if old is not None and pos == len(old):
+                return  # contenu identique : rien à faire
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            _writev_all(fd, pending)
+        if fsync and _barrier_dirs is None:
+            os.fsync(fd)
+        fd, opened = -2, fd  # -2 : fermé, .tmp encore présent jusqu'au renommage
+        os.close(opened)
+        os.replace(tmp, path)
+    except BaseException:
+        # Rendu ou renommage interrompu : pas de .tmp orphelin
+        # (il serait publié par git add docs/)
+        if fd != -1:
+            if fd >= 0:
+                os.close(fd)
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+        raise
+    if _barrier_dirs is not None:
+        _barrier_dirs.add(path.parent)
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """os.write en boucle jusqu'à ce que tout soit écrit."""
+    mv = memoryview(data)
+    while mv:
+        mv = mv[os.write(fd, mv):]
+
+
+try:
+    _IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):  # Windows, ou inconnu
+    _IOV_MAX = -1
+if _IOV_MAX <= 0:
+    _IOV_MAX = 1024  # minimum courant (Linux, macOS)
+
+
+def _writev_all(fd: int, bufs: list[bytes]) -> None:
+    """Écriture groupée (os.writev) de plusieurs fragments, sans les concaténer."""
+    if not hasattr(os, "writev"):  # Windows
+        for b in bufs:
+            _write_all(fd, b)
+        return
+    views = [memoryview(b) for b in bufs if b]
+    i = 0
+    while i < len(views):
+        n = os.writev(fd, views[i:i + _IOV_MAX])  # au-delà d'IOV_MAX : EINVAL
+        while i < len(views) and n >= len(views[i]):
+            n -= len(views[i])
+            i += 1
+        if n:
+            views[i] = views[i][n:]
+
+
+@contextmanager
+def fsync_barrier() -> Iterator[None]:
+    """Regroupe les fsync de tout un bloc (ex. un run complet de generate.py).
+    Dans le bloc, atomic_write n'attend plus le disque fichier par fichier ;
+    à la sortie, un seul os.sync() rend durables tous les fichiers écrits,
+    puis chaque dossier modifié est synchronisé une fois (renommages)."""
+    global _barrier_dirs
+    if _barrier_dirs is not None:  # déjà dans une barrière : elle s'en charge
+        yield
+        return
+    _barrier_dirs = dirs = set()
+    try:
+        yield
+    finally:
+        _barrier_dirs = None
+        if dirs:
+            if hasattr(os, "sync"):
+                os.sync()
+            for directory in dirs:
+                sync_dir(directory)
+
+
+def sync_dir(directory: Path) -> None:
+    """fsync d'un dossier : rend durables, en un seul appel, les renommages
+    d'un lot d'écritures faites avec fsync=False."""
+    fd = os.open(directory, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass  # certains systèmes de fichiers refusent fsync sur un dossier
+    finally:
+        os.close(fd)
 
 
 def fetch_static_html(url: str, timeout: int = 15) -> str | None:
     """Télécharge une page HTML statique (sans JS rendering). Retourne le contenu ou None."""
+    import urllib.request  # import coûteux (http.client, email…), seulement si utilisé
     try:
         req = urllib.request.Request(
             url, headers={"User-Agent": "Mozilla/5.0 (compatible; solution-du-jour/1.0)"}
@@ -76,23 +270,177 @@ def jackpot_html(jackpot_won: bool | None, jackpot_winners: int, jackpot_amount:
     return f'      <p class="puzzle-meta" style="margin-top:.5rem;">{status}</p>'
 
 
-def load_all_archives(archive_dir: Path, required_keys: list[str] | None = None) -> list[dict]:
+def _read_archive_file(path: str) -> dict | None:
+    """Lit un fichier d'archive JSON. Retourne None s'il est illisible."""
+    try:
+        with open(path, "rb") as fp:
+            data = json_loads(fp.read())
+    except Exception:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _read_archive_index(archive_dir: Path) -> dict:
+    """Charge l'index .index.json : {nom: [[mtime_ns, taille], données]}."""
+    try:
+        index = json_loads((archive_dir / ARCHIVE_INDEX_NAME).read_bytes())
+    except Exception:
+        return {}
+    return index if isinstance(index, dict) else {}
+
+
+def iter_all_archives(
+    archive_dir: Path,
+    required_keys: list[str] | None = None,
+    slim: bool = False,
+) -> Iterator[dict]:
     """
-    Charge tous les fichiers JSON d'un dossier archive (pattern YYYY-MM-DD.json).
-    Retourne une liste triée par date DESC.
+    Parcourt les fichiers JSON d'un dossier archive (pattern YYYY-MM-DD.json),
+    du plus récent au plus ancien, en les produisant un par un.
     required_keys : clés JSON obligatoires (défaut : ["date", "word"]).
+    slim : ne conserve que les required_keys de chaque entrée (moins de mémoire
+           quand l'appelant n'a pas besoin du reste, ex. données du simulateur).
+
+    Les noms YYYY-MM-DD.json se trient comme les dates : le tri se fait sur les
+    noms de fichiers, avant tout parsing. Les fichiers sont lus par lots, au fur
+    et à mesure de la consommation : islice(iter_all_archives(d), 10) ne lit
+    que les premiers fichiers.
+
+    Les documents déjà parsés sont mis en cache dans archive_dir/.index.json,
+    indexés par (mtime_ns, taille) : seuls les fichiers nouveaux ou modifiés
+    depuis le dernier appel sont relus. L'index est réécrit à la fin du
+    parcours (ou à la fermeture du générateur) si nécessaire.
     """
-    import json
     if required_keys is None:
         required_keys = ["date", "word"]
-    entries = []
-    if archive_dir.exists():
-        for f in archive_dir.glob("????-??-??.json"):
+    if not archive_dir.exists():
+        return
+    # os.scandir + regex précompilée sur le nom : pas d'objet Path ni de fnmatch par entrée
+    listing = []
+    with os.scandir(archive_dir) as it:
+        for entry in it:
+            if _ARCHIVE_RE(entry.name):
+                st = entry.stat()
+                listing.append((entry.name, entry.path, [st.st_mtime_ns, st.st_size]))
+    listing.sort(reverse=True)
+
+    index = _read_archive_index(archive_dir)
+    fresh = {name: index[name] for name, _, _ in listing if name in index}
+    changed = fresh.keys() != index.keys()
+    try:
+        with ThreadPoolExecutor(max_workers=_ARCHIVE_WORKERS) as pool:
+            for start in range(0, len(listing), _ARCHIVE_BATCH):
+                batch = listing[start:start + _ARCHIVE_BATCH]
+                stale = []
+                for name, path, sig in batch:
+                    cached = index.get(name)
+                    if not (cached and cached[0] == sig):
+                        stale.append((name, path, sig))
+                if stale:
+                    # Fichiers indépendants : lecture disque + parsing répartis sur un pool de threads
+                    changed = True
+                    docs = pool.map(lambda item: _read_archive_file(item[1]), stale)
+                    for (name, _, sig), data in zip(stale, docs):
+                        if data is not None:
+                            fresh[name] = [sig, data]
+                        else:
+                            fresh.pop(name, None)
+                for name, _, _ in batch:
+                    if name not in fresh:
+                        continue
+                    data = fresh[name][1]
+                    if all(k in data for k in required_keys):
+                        yield {k: data[k] for k in required_keys} if slim else data
+    finally:
+        if changed:
             try:
-                data = json.loads(f.read_text(encoding="utf-8"))
-                if all(k in data for k in required_keys):
-                    entries.append(data)
-            except Exception:
-                pass
-    entries.sort(key=lambda x: x["date"], reverse=True)
-    return entries
+                atomic_write(archive_dir / ARCHIVE_INDEX_NAME,
+                             json.dumps(fresh, ensure_ascii=False, separators=(",", ":")))
+            except OSError as e:
+                print(f"   ⚠ Index d'archive non écrit ({archive_dir}) : {e}")
+
+
+def load_all_archives(
+    archive_dir: Path,
+    required_keys: list[str] | None = None,
+    slim: bool = False,
+    limit: int | None = None,
+) -> list[dict]:
+    """
+    Charge tous les fichiers JSON d'un dossier archive (pattern YYYY-MM-DD.json).
+    Retourne une liste triée par date DESC (voir iter_all_archives).
+    limit : ne conserve que les `limit` entrées les plus récentes.
+    """
+    # closing : l'index est écrit dès la sortie, même si limit coupe le parcours
+    with closing(iter_all_archives(archive_dir, required_keys, slim)) as it:
+        return list(islice(it, limit))
+
+
+def archive_dates(archive_dir: Path) -> list[str]:
+    """
+    Dates ISO ('YYYY-MM-DD') des fichiers .json d'un dossier archive, triées DESC.
+    Le format ISO se trie comme les dates : ni parsing ni objet date.
+
+    La liste (noms triés) est mémorisée dans archive_dir.parent/.archive-dates.json
+    avec le mtime du dossier : tant qu'aucun fichier n'y a été ajouté, renommé ou
+    supprimé, elle est relue telle quelle, sans parcourir le dossier. Le cache est
+    rangé hors du dossier pour que son écriture ne change pas ce mtime.
+    """
+    try:
+        mtime = archive_dir.stat().st_mtime_ns
+    except OSError:
+        return []
+    cache_path = archive_dir.parent / ARCHIVE_DATES_NAME
+    try:
+        cached = json_loads(cache_path.read_bytes())
+        if cached["mtime_ns"] == mtime:
+            return cached["dates"]
+    except Exception:
+        pass
+    # os.scandir + regex sur le nom : ni objet Path, ni fnmatch, ni stat par entrée
+    with os.scandir(archive_dir) as it:
+        names = sorted((e.name[:-5] for e in it if _ARCHIVE_RE(e.name)), reverse=True)
+    try:
+        atomic_write(cache_path, json.dumps({"mtime_ns": mtime, "dates": names},
+                                            separators=(",", ":")))
+    except OSError as e:
+        print(f"   ⚠ Liste des dates non écrite ({cache_path}) : {e}")
+    return names
+
+
+# ── Manifeste des pages générées ──────────────────────────────────────────────
+
+def page_key(*inputs) -> str:
+    """Empreinte (blake2b) des entrées d'une page : si elle n'a pas changé,
+    la page déjà écrite sur disque est identique et peut être conservée.
+    Les dates et autres objets non JSON sont sérialisés via str().
+    """
+    raw = json.dumps(inputs, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def code_key(*paths: str | Path) -> str:
+    """Empreinte des sources qui produisent les pages (modules du jeu + core.py),
+    à inclure dans page_key : toute modification du code invalide le manifeste.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for path in (*paths, __file__):
+        h.update(Path(path).read_bytes())
+    return h.hexdigest()
+
+
+def load_manifest(path: Path) -> dict:
+    """Charge un manifeste {date: empreinte}. Retourne {} s'il est absent ou illisible."""
+    try:
+        manifest = json_loads(path.read_bytes())
+    except Exception:
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def save_manifest(path: Path, manifest: dict) -> None:
+    """Écrit un manifeste {date: empreinte} (simple avertissement en cas d'échec)."""
+    try:
+        atomic_write(path, json.dumps(manifest, separators=(",", ":"), sort_keys=True))
+    except OSError as e:
+        print(f"   ⚠ Manifeste non écrit ({path}) : {e}")
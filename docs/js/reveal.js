@@ -0,0 +1,10 @@
+// Hub : révélation des solutions floutées.
+// Un seul écouteur délégué pour tous les boutons <button data-target="sol-…">.
+document.addEventListener('click', function (e) {
+  var btn = e.target.closest('button[data-target]');
+  if (!btn) return;
+  e.preventDefault();  // le bouton est dans la carte-lien <a class="game-card">
+  var el = document.getElementById(btn.dataset.target);
+  if (el) el.classList.add('revealed');
+  btn.style.display = 'none';
+});
@@ -9,13 +9,23 @@ Génère :
   docs/cemantix/archive/index.html
 """
 
-import json
+import os
 import re
+import threading
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import date, datetime, timezone
 from html import escape as _html_escape
+from operator import itemgetter
 from pathlib import Path
 
-from core import SITE_URL, DOCS_DIR, _session, date_fr, atomic_write, load_all_archives as _load_archives
+from core import (
+    SITE_URL, DOCS_DIR, PAGE_MANIFEST_NAME, get_session, date_fr,
+    atomic_write, atomic_write_iter, sync_dir,
+    json_loads, json_dumps_pretty, code_key, page_key, load_manifest, save_manifest,
+    load_all_archives as _load_archives,
+)
 
 # ── Configuration Cémantix ────────────────────────────────────────────────────
 
@@ -30,6 +40,14 @@ HEADERS = {
     "Referer": BASE_URL + "/",
 }
 
+# Balise <script id="script" data-puzzle-number="…"> de la page d'accueil
+# (attributs dans n'importe quel ordre : le numéro est cherché dans la balise)
+_SCRIPT_TAG_RE = re.compile(rb'<script\b[^>]*\sid=["\']script["\'][^>]*>')
+_PUZZLE_NUM_RE = re.compile(rb'\sdata-puzzle-number=["\'](\d+)["\']')
+
+# Clé de tri des voisins /nearby : (percentile, similarité, mot)
+_percentile = itemgetter(0)
+
 # Point de référence pour calculer le numéro de puzzle par la date
 _REF_DATE = date(2026, 2, 28)
 _REF_PUZZLE = 1459
@@ -42,13 +60,12 @@ def get_puzzle_number() -> int:
     Récupère le numéro du puzzle depuis le HTML du site.
     Fallback : calcul à partir d'un point de référence connu.
     """
-    from bs4 import BeautifulSoup
     try:
-        resp = _session.get(BASE_URL, headers=HEADERS, timeout=10)
-        soup = BeautifulSoup(resp.text, "html.parser")
-        script = soup.find("script", id="script")
-        if script and "data-puzzle-number" in script.attrs:
-            return int(script["data-puzzle-number"])
+        resp = get_session().get(BASE_URL, headers=HEADERS, timeout=10)
+        tag = _SCRIPT_TAG_RE.search(resp.content)
+        m = _PUZZLE_NUM_RE.search(tag.group()) if tag else None
+        if m:
+            return int(m.group(1))
         print("   ⚠ Tag <script id='script'> non trouvé — utilisation du fallback date")
     except Exception as e:
         print(f"   ⚠ Erreur lors de la récupération du puzzle : {e}")
@@ -59,29 +76,27 @@ def get_puzzle_number() -> int:
     return puzzle_num
 
 
-def get_nearby(word: str, puzzle_num: int) -> list[dict]:
+def get_nearby(word: str, puzzle_num: int) -> list[tuple[int, float, str]]:
     """
     Appelle /nearby (POST) pour récupérer les voisins de la solution.
-    Retourne une liste triée par percentile ASC.
+    Retourne une liste de tuples (percentile, similarité, mot) triée par percentile ASC.
     """
     try:
-        resp = _session.post(
+        resp = get_session().post(
             f"{BASE_URL}/nearby?n={puzzle_num}",
             data=f"word={word}",
             headers=HEADERS,
             timeout=15,
         )
-        data = resp.json()
+        data = json_loads(resp.content)  # bytes → orjson si disponible
         if isinstance(data, dict):
-            results = []
-            for w, val in data.items():
-                if isinstance(val, (list, tuple)) and len(val) >= 2:
-                    results.append({
-                        "word": str(w),
-                        "percentile": int(val[0]),
-                        "similarity": float(val[1]),
-                    })
-            return sorted(results, key=lambda x: x["percentile"])
+            results = [
+                (int(val[0]), float(val[1]), str(w))
+                for w, val in data.items()
+                if isinstance(val, (list, tuple)) and len(val) >= 2
+            ]
+            results.sort(key=_percentile)
+            return results
     except Exception as e:
         print(f"   ⚠ Erreur /nearby : {e}")
     return []
@@ -90,7 +105,7 @@ def get_nearby(word: str, puzzle_num: int) -> list[dict]:
 def fetch_definition(word: str) -> str:
     """Récupère la première phrase de définition via l'API REST de Wikipédia (fr)."""
     try:
-        resp = _session.get(
+        resp = get_session().get(
             f"https://fr.wikipedia.org/api/rest_v1/page/summary/{word}",
             timeout=10,
         )
@@ -106,7 +121,7 @@ def fetch_definition(word: str) -> str:
 
 # ── Sélection des indices ─────────────────────────────────────────────────────
 
-def select_hints(nearby: list[dict]) -> dict:
+def select_hints(nearby: list[tuple[int, float, str]]) -> dict:
     """
     Sélectionne 3 niveaux d'indices depuis la liste des voisins triés.
 
@@ -114,16 +129,16 @@ def select_hints(nearby: list[dict]) -> dict:
     Niveau 2 (proche)      : percentile ~500-700
     Niveau 3 (très proche) : percentile ~800-950
     """
+    # nearby est trié par percentile : chaque tranche se délimite par bisection
     def pick(lo: int, hi: int, count: int = 3) -> list[dict]:
-        candidates = [
-            {"word": item["word"], "percentile": item["percentile"]}
-            for item in nearby
-            if lo <= item["percentile"] <= hi
+        i0 = bisect_left(nearby, lo, key=_percentile)
+        i1 = bisect_right(nearby, hi, lo=i0, key=_percentile)
+        n = i1 - i0
+        step = n // count if n > count else 1
+        return [
+            {"word": w, "percentile": perc}
+            for perc, _, w in nearby[i0:i1:step][:count]
         ]
-        if len(candidates) <= count:
-            return candidates
-        step = len(candidates) // count
-        return [candidates[i * step] for i in range(count)]
 
     return {
         "level1": pick(200, 400),
@@ -144,7 +159,12 @@ def enrich_hints_with_definitions(hints: dict) -> dict:
 # ── Chargement des archives ───────────────────────────────────────────────────
 
 def load_all_archives() -> list[dict]:
-    return _load_archives(CEMANTIX_ARCHIVE, required_keys=["date", "word", "puzzle_num"])
+    entries = _load_archives(CEMANTIX_ARCHIVE, required_keys=["date", "word", "puzzle_num"])
+    # Date parsée et formatée une seule fois, réutilisée par toutes les pages
+    for e in entries:
+        e["_date"] = d = date.fromisoformat(e["date"])
+        e["_date_fr"] = date_fr(d)
+    return entries
 
 
 # ── Génération des fichiers ───────────────────────────────────────────────────
@@ -169,14 +189,15 @@ def generate_solution_json(
         "generated_at": datetime.now(timezone.utc).isoformat(),
     }
     CEMANTIX_DIR.mkdir(parents=True, exist_ok=True)
-    atomic_write(CEMANTIX_DIR / "solution.json", json.dumps(data, ensure_ascii=False, indent=2))
+    atomic_write(CEMANTIX_DIR / "solution.json", json_dumps_pretty(data))
     return data
 
 
-def generate_archive_json(today: date, data: dict) -> None:
+def generate_archive_json(today: date, data: dict, raw: bytes | None = None) -> None:
+    """raw : data déjà sérialisé (octets de solution.json) — pas de re-sérialisation."""
     CEMANTIX_ARCHIVE.mkdir(parents=True, exist_ok=True)
     atomic_write(CEMANTIX_ARCHIVE / f"{today.isoformat()}.json",
-                 json.dumps(data, ensure_ascii=False, indent=2))
+                 raw if raw is not None else json_dumps_pretty(data))
 
 
 def _mask_word(word: str, text: str) -> str:
@@ -254,36 +275,14 @@ def _hints_html(hints: dict) -> tuple:
     )
 
 
-def generate_archive_html(
-    d: date,
-    puzzle_num: int,
-    word: str,
-    hints: dict,
-    prev_date,  # date | None — plus ancienne
-    next_date,  # date | None — plus récente (None → lien vers index.html)
-    definition: str = "",
-) -> None:
-    """Génère docs/cemantix/archive/YYYY-MM-DD.html."""
-    CEMANTIX_ARCHIVE.mkdir(parents=True, exist_ok=True)
-    date_str = d.isoformat()
-    date_display = date_fr(d)
-    hints_l1, hints_l2, hints_l3 = _hints_html(hints)
-    word_hints_card = _word_hints_card_html(word, definition)
+# ── Gabarits HTML ─────────────────────────────────────────────────────────────
+# Texte constant construit une seule fois ; seuls les champs {…} sont substitués
+# (str.format_map) à chaque page. Les accolades littérales (JSON-LD, JS) sont doublées.
+# Chaque page = en-tête + corps + script commun, écrits fragment par fragment.
 
-    if prev_date is not None:
-        nav_prev = f'<a class="nav-link" href="{prev_date.isoformat()}">&#8592; {date_fr(prev_date)}</a>'
-    else:
-        nav_prev = '<span class="nav-disabled">&#8592; Plus ancien</span>'
+_NO_HINTS_HTML = "<em>Aucun indice disponible</em>"
 
-    if next_date is not None:
-        nav_next = f'<a class="nav-link" href="{next_date.isoformat()}">{date_fr(next_date)} &#8594;</a>'
-    else:
-        nav_next = '<a class="nav-link" href="../">Solution du jour &#8594;</a>'
-
-    first_letter = word[0].upper() if word else "?"
-    word_length = len(word)
-    letters_plural = "s" if word_length > 1 else ""
-    faq_extra = f""",
+_FAQ_EXTRA_TPL = """,
       {{
         "@type": "Question",
         "name": "Quelle est la premi\u00e8re lettre du C\u00e9mantix du {date_display} ?",
@@ -300,9 +299,8 @@ def generate_archive_html(
           "text": "Le mot du C\u00e9mantix #{puzzle_num} du {date_display} contient {word_length} lettre{letters_plural}."
         }}
       }}"""
-    if definition:
-        safe_def = definition.replace('"', "'")
-        faq_extra += f""",
+
+_FAQ_DEF_TPL = """,
       {{
         "@type": "Question",
         "name": "Quelle est la d\u00e9finition du mot du C\u00e9mantix du {date_display} ?",
@@ -312,7 +310,7 @@ def generate_archive_html(
         }}
       }}"""
 
-    html = f"""<!DOCTYPE html>
+_ARCHIVE_HEAD_TPL = """<!DOCTYPE html>
 <html lang="fr">
 <head>
   <meta charset="UTF-8">
@@ -382,14 +380,16 @@ def generate_archive_html(
     ]
   }}
   </script>
-  {f'<link rel="prev" href="{prev_date.isoformat()}">' if prev_date else ''}
-  {f'<link rel="next" href="{next_date.isoformat()}">' if next_date else ''}
+  {link_prev}
+  {link_next}
 
   <link rel="stylesheet" href="../../css/style.css">
   <script data-goatcounter="https://j0hanj0han.goatcounter.com/count"
           async src="https://gc.zgo.at/count.js"></script>
 </head>
-<body>
+"""
+
+_ARCHIVE_BODY_TPL = """<body>
 
 <header class="site-header">
   <h1>Cémantix #{puzzle_num} — Solution du {date_display}</h1>
@@ -433,7 +433,7 @@ def generate_archive_html(
         </button>
         <div class="hint-content" id="content-l1">
           <p>Ces mots sont <strong>sémantiquement proches</strong> de la solution (zone tiède) :</p>
-          <div class="hint-words">{hints_l1 or "<em>Aucun indice disponible</em>"}</div>
+          <div class="hint-words">{hints_l1}</div>
         </div>
       </div>
 
@@ -443,7 +443,7 @@ def generate_archive_html(
         </button>
         <div class="hint-content" id="content-l2">
           <p>Ces mots sont <strong>très proches</strong> de la solution (zone chaude) :</p>
-          <div class="hint-words">{hints_l2 or "<em>Aucun indice disponible</em>"}</div>
+          <div class="hint-words">{hints_l2}</div>
         </div>
       </div>
 
@@ -453,7 +453,7 @@ def generate_archive_html(
         </button>
         <div class="hint-content" id="content-l3">
           <p>Ces mots sont <strong>extrêmement proches</strong> de la solution (zone brûlante) :</p>
-          <div class="hint-words">{hints_l3 or "<em>Aucun indice disponible</em>"}</div>
+          <div class="hint-words">{hints_l3}</div>
         </div>
       </div>
     </div>
@@ -489,234 +489,9 @@ def generate_archive_html(
   <p style="margin-top:.4rem;">Site non officiel — Solution générée automatiquement</p>
 </footer>
 
-<script>
-  var revealed = [false, false, false];
-
-  function revealHint(level) {{
-    if (level > 1 && !revealed[level - 2]) return;
-    var btn = document.getElementById('btn-l' + level);
-    var content = document.getElementById('content-l' + level);
-    content.classList.add('visible');
-    btn.disabled = true;
-    revealed[level - 1] = true;
-    var next = level + 1;
-    if (next <= 3) {{
-      var nextBtn = document.getElementById('btn-l' + next);
-      if (nextBtn) nextBtn.disabled = false;
-    }}
-  }}
-
-  function revealSolution() {{
-    document.getElementById('solution-wrap').classList.add('revealed');
-    document.getElementById('reveal-btn').style.display = 'none';
-  }}
-
-  function revealWordHint(key) {{
-    var el = document.getElementById('wh-' + key);
-    if (el) el.classList.add('visible');
-    var btn = document.getElementById('wh-' + key + '-btn');
-    if (btn) btn.style.display = 'none';
-  }}
-
-  function toggleDef(el) {{
-    var wasActive = el.classList.contains('active');
-    document.querySelectorAll('.hint-tag.active').forEach(function(t) {{ t.classList.remove('active'); }});
-    var popup = document.getElementById('hd-popup');
-    if (!popup) {{
-      popup = document.createElement('div');
-      popup.id = 'hd-popup';
-      popup.className = 'hint-def-popup';
-      document.body.appendChild(popup);
-    }}
-    if (wasActive) {{ popup.style.display = 'none'; return; }}
-    var def = el.getAttribute('data-def');
-    if (!def) return;
-    el.classList.add('active');
-    popup.textContent = def;
-    popup.style.display = 'block';
-    var rect = el.getBoundingClientRect();
-    popup.style.left = Math.max(8, Math.min(rect.left + window.scrollX, window.innerWidth - 275)) + 'px';
-    popup.style.top = (rect.bottom + window.scrollY + 6) + 'px';
-  }}
-  document.addEventListener('click', function(e) {{
-    if (!e.target.classList.contains('hint-tag')) {{
-      var p = document.getElementById('hd-popup');
-      if (p) p.style.display = 'none';
-      document.querySelectorAll('.hint-tag.active').forEach(function(t) {{ t.classList.remove('active'); }});
-    }}
-  }});
-</script>
-
-</body>
-</html>"""
-
-    atomic_write(CEMANTIX_ARCHIVE / f"{date_str}.html", html)
-
-
-def generate_archive_index(entries: list[dict]) -> None:
-    """Génère docs/cemantix/archive/index.html — liste de toutes les solutions."""
-    CEMANTIX_ARCHIVE.mkdir(parents=True, exist_ok=True)
-
-    def item_html(e: dict) -> str:
-        d = date.fromisoformat(e["date"])
-        return (
-            f'      <li class="arch-item">'
-            f'<span class="arch-date">{date_fr(d)}</span>'
-            f'<span class="arch-num">#{e["puzzle_num"]}</span>'
-            f'<a class="arch-link" href="{e["date"]}">{e["word"].upper()}</a>'
-            f'</li>'
-        )
-
-    items_html = "\n".join(item_html(e) for e in entries)
-    count = len(entries)
-
-    html = f"""<!DOCTYPE html>
-<html lang="fr">
-<head>
-  <meta charset="UTF-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <link rel="icon" href="/favicon.svg" type="image/svg+xml">
-
-  <title>Archives Cémantix — Toutes les solutions du jour</title>
-  <meta name="description" content="Retrouvez toutes les solutions passées de Cémantix : réponses et indices de chaque puzzle depuis le début.">
-  <meta name="robots" content="index, follow">
-  <link rel="canonical" href="{CEMANTIX_SITE_URL}/archive/">
-  <meta name="google-site-verification" content="KLhfwprI4hatb7c2RyrwsiYjulATuj0vJueDdJt0yLs">
-
-  <meta property="og:title" content="Archives Cémantix — Toutes les solutions">
-  <meta property="og:description" content="Toutes les solutions passées du jeu Cémantix avec indices progressifs.">
-  <meta property="og:type" content="website">
-  <meta property="og:url" content="{CEMANTIX_SITE_URL}/archive/">
-  <meta property="og:locale" content="fr_FR">
-  <meta property="og:site_name" content="Solutions du Jour">
-
-  <script type="application/ld+json">
-  {{
-    "@context": "https://schema.org",
-    "@type": "BreadcrumbList",
-    "itemListElement": [
-      {{"@type": "ListItem", "position": 1, "name": "Accueil", "item": "{SITE_URL}/"}},
-      {{"@type": "ListItem", "position": 2, "name": "Cémantix", "item": "{CEMANTIX_SITE_URL}/"}},
-      {{"@type": "ListItem", "position": 3, "name": "Archives"}}
-    ]
-  }}
-  </script>
-
-  <link rel="stylesheet" href="../../css/style.css">
-  <script data-goatcounter="https://j0hanj0han.goatcounter.com/count"
-          async src="https://gc.zgo.at/count.js"></script>
-</head>
-<body>
-
-<header class="site-header">
-  <h1>Archives Cémantix</h1>
-  <p class="subtitle">{count} solution{"s" if count > 1 else ""} enregistrée{"s" if count > 1 else ""}</p>
-</header>
-
-<main>
-<nav class="breadcrumb" aria-label="Fil d'Ariane">
-  <a href="{SITE_URL}/">Accueil</a> &rsaquo;
-  <a href="../">Cémantix</a> &rsaquo;
-  <span>Archives</span>
-</nav>
-  <div class="card">
-    <h2>Toutes les solutions Cémantix ({count})</h2>
-    <p style="font-size:.9rem;color:#6b7280;margin-bottom:1rem;">
-      Cliquez sur un mot pour voir la solution complète et les indices de ce jour.
-    </p>
-    <ul class="arch-list">
-{items_html}
-    </ul>
-  </div>
-
-  <div style="text-align:center;margin-top:.5rem;">
-    <a class="reveal-btn" href="../">Solution du jour &#8594;</a>
-  </div>
-</main>
-
-<footer>
-  <p>
-    <a href="../">Solution du jour</a> ·
-    <a href="https://cemantix.certitudes.org" rel="noopener" target="_blank">Jouer à Cémantix</a>
-  </p>
-  <p style="margin-top:.4rem;">Site non officiel — Solution générée automatiquement</p>
-</footer>
-
-</body>
-</html>"""
-
-    atomic_write(CEMANTIX_ARCHIVE / "index.html", html)
-
-
-def generate_index_html(
-    today: date,
-    puzzle_num: int,
-    word: str,
-    hints: dict,
-    definition: str = "",
-    recent_archives: list | None = None,
-) -> None:
-    """Génère docs/cemantix/index.html."""
-    date_str = today.isoformat()
-    date_display = date_fr(today)
-    hints_l1, hints_l2, hints_l3 = _hints_html(hints)
-    word_hints_card = _word_hints_card_html(word, definition)
-    first_letter = word[0].upper() if word else "?"
-    word_length = len(word)
-    letters_plural = "s" if word_length > 1 else ""
-    faq_extra = f""",
-      {{
-        "@type": "Question",
-        "name": "Quelle est la premi\u00e8re lettre du C\u00e9mantix du {date_display} ?",
-        "acceptedAnswer": {{
-          "@type": "Answer",
-          "text": "La premi\u00e8re lettre du C\u00e9mantix #{puzzle_num} du {date_display} est : {first_letter}."
-        }}
-      }},
-      {{
-        "@type": "Question",
-        "name": "Combien de lettres contient le mot du C\u00e9mantix du {date_display} ?",
-        "acceptedAnswer": {{
-          "@type": "Answer",
-          "text": "Le mot du C\u00e9mantix #{puzzle_num} du {date_display} contient {word_length} lettre{letters_plural}."
-        }}
-      }}"""
-    if definition:
-        safe_def = definition.replace('"', "'")
-        faq_extra += f""",
-      {{
-        "@type": "Question",
-        "name": "Quelle est la d\u00e9finition du mot du C\u00e9mantix du {date_display} ?",
-        "acceptedAnswer": {{
-          "@type": "Answer",
-          "text": "{safe_def}"
-        }}
-      }}"""
-
-    recent_archives_card = ""
-    if recent_archives:
-        def arch_item(e: dict) -> str:
-            d = date.fromisoformat(e["date"])
-            return (
-                f'      <li class="arch-item">'
-                f'<span class="arch-date">{date_fr(d)}</span>'
-                f'<span class="arch-num">#{e["puzzle_num"]}</span>'
-                f'<a class="arch-link" href="archive/{e["date"]}">{e["word"].upper()}</a>'
-                f'</li>'
-            )
-        items = "\n".join(arch_item(e) for e in recent_archives[:7])
-        recent_archives_card = f"""
-    <div class="card">
-      <h2>Solutions précédentes</h2>
-      <ul class="arch-list">
-{items}
-      </ul>
-      <p style="margin-top:.75rem;font-size:.9rem;">
-        <a href="archive/">Voir toutes les archives &#8594;</a>
-      </p>
-    </div>"""
+"""
 
-    html = f"""<!DOCTYPE html>
+_INDEX_HEAD_TPL = """<!DOCTYPE html>
 <html lang="fr">
 <head>
   <meta charset="UTF-8">
@@ -805,7 +580,9 @@ def generate_index_html(
   <script data-goatcounter="https://j0hanj0han.goatcounter.com/count"
           async src="https://gc.zgo.at/count.js"></script>
 </head>
-<body>
+"""
+
+_INDEX_BODY_TPL = """<body>
 
 <header class="site-header">
   <h1>Cémantix — Solution du jour</h1>
@@ -841,7 +618,7 @@ def generate_index_html(
         </button>
         <div class="hint-content" id="content-l1">
           <p>Ces mots sont <strong>sémantiquement proches</strong> de la solution (zone tiède) :</p>
-          <div class="hint-words">{hints_l1 or "<em>Aucun indice disponible</em>"}</div>
+          <div class="hint-words">{hints_l1}</div>
         </div>
       </div>
 
@@ -851,7 +628,7 @@ def generate_index_html(
         </button>
         <div class="hint-content" id="content-l2">
           <p>Ces mots sont <strong>très proches</strong> de la solution (zone chaude) :</p>
-          <div class="hint-words">{hints_l2 or "<em>Aucun indice disponible</em>"}</div>
+          <div class="hint-words">{hints_l2}</div>
         </div>
       </div>
 
@@ -861,7 +638,7 @@ def generate_index_html(
         </button>
         <div class="hint-content" id="content-l3">
           <p>Ces mots sont <strong>extrêmement proches</strong> de la solution (zone brûlante) :</p>
-          <div class="hint-words">{hints_l3 or "<em>Aucun indice disponible</em>"}</div>
+          <div class="hint-words">{hints_l3}</div>
         </div>
       </div>
     </div>
@@ -914,10 +691,13 @@ def generate_index_html(
   <p style="margin-top:.4rem;">Jouer sur <a href="https://cemantix.certitudes.org" rel="noopener" target="_blank">cemantix.certitudes.org</a></p>
 </footer>
 
-<script>
+"""
+
+# Script commun aux deux pages (texte brut, non formaté)
+_PAGE_SCRIPT = """<script>
   var revealed = [false, false, false];
 
-  function revealHint(level) {{
+  function revealHint(level) {
     if (level > 1 && !revealed[level - 2]) return;
     var btn = document.getElementById('btn-l' + level);
     var content = document.getElementById('content-l' + level);
@@ -925,35 +705,35 @@ def generate_index_html(
     btn.disabled = true;
     revealed[level - 1] = true;
     var next = level + 1;
-    if (next <= 3) {{
+    if (next <= 3) {
       var nextBtn = document.getElementById('btn-l' + next);
       if (nextBtn) nextBtn.disabled = false;
-    }}
-  }}
+    }
+  }
 
-  function revealSolution() {{
+  function revealSolution() {
     document.getElementById('solution-wrap').classList.add('revealed');
     document.getElementById('reveal-btn').style.display = 'none';
-  }}
+  }
 
-  function revealWordHint(key) {{
+  function revealWordHint(key) {
     var el = document.getElementById('wh-' + key);
     if (el) el.classList.add('visible');
     var btn = document.getElementById('wh-' + key + '-btn');
     if (btn) btn.style.display = 'none';
-  }}
+  }
 
-  function toggleDef(el) {{
+  function toggleDef(el) {
     var wasActive = el.classList.contains('active');
-    document.querySelectorAll('.hint-tag.active').forEach(function(t) {{ t.classList.remove('active'); }});
+    document.querySelectorAll('.hint-tag.active').forEach(function(t) { t.classList.remove('active'); });
     var popup = document.getElementById('hd-popup');
-    if (!popup) {{
+    if (!popup) {
       popup = document.createElement('div');
       popup.id = 'hd-popup';
       popup.className = 'hint-def-popup';
       document.body.appendChild(popup);
-    }}
-    if (wasActive) {{ popup.style.display = 'none'; return; }}
+    }
+    if (wasActive) { popup.style.display = 'none'; return; }
     var def = el.getAttribute('data-def');
     if (!def) return;
     el.classList.add('active');
@@ -962,49 +742,353 @@ def generate_index_html(
     var rect = el.getBoundingClientRect();
     popup.style.left = Math.max(8, Math.min(rect.left + window.scrollX, window.innerWidth - 275)) + 'px';
     popup.style.top = (rect.bottom + window.scrollY + 6) + 'px';
-  }}
-  document.addEventListener('click', function(e) {{
-    if (!e.target.classList.contains('hint-tag')) {{
+  }
+  document.addEventListener('click', function(e) {
+    if (!e.target.classList.contains('hint-tag')) {
       var p = document.getElementById('hd-popup');
       if (p) p.style.display = 'none';
-      document.querySelectorAll('.hint-tag.active').forEach(function(t) {{ t.classList.remove('active'); }});
-    }}
-  }});
+      document.querySelectorAll('.hint-tag.active').forEach(function(t) { t.classList.remove('active'); });
+    }
+  });
 </script>
 
 </body>
 </html>"""
 
-    atomic_write(CEMANTIX_DIR / "index.html", html)
+
+def _render_page(ctx: dict, head_tpl: str, body_tpl: str) -> Iterator[str]:
+    """Produit la page fragment par fragment (voir atomic_write_iter)."""
+    yield head_tpl.format_map(ctx)
+    yield body_tpl.format_map(ctx)
+    yield _PAGE_SCRIPT
+
+
+def generate_archive_html(
+    d: date,
+    puzzle_num: int,
+    word: str,
+    hints: dict,
+    prev_date,  # date | None — plus ancienne
+    next_date,  # date | None — plus récente (None → lien vers index.html)
+    definition: str = "",
+    fsync: bool = True,
+) -> None:
+    """Génère docs/cemantix/archive/YYYY-MM-DD.html."""
+    CEMANTIX_ARCHIVE.mkdir(parents=True, exist_ok=True)
+    date_str = d.isoformat()
+    date_display = date_fr(d)
+    hints_l1, hints_l2, hints_l3 = _hints_html(hints)
+    word_hints_card = _word_hints_card_html(word, definition)
+
+    if prev_date is not None:
+        nav_prev = f'<a class="nav-link" href="{prev_date.isoformat()}">&#8592; {date_fr(prev_date)}</a>'
+    else:
+        nav_prev = '<span class="nav-disabled">&#8592; Plus ancien</span>'
+
+    if next_date is not None:
+        nav_next = f'<a class="nav-link" href="{next_date.isoformat()}">{date_fr(next_date)} &#8594;</a>'
+    else:
+        nav_next = '<a class="nav-link" href="../">Solution du jour &#8594;</a>'
+
+    first_letter = word[0].upper() if word else "?"
+    word_length = len(word)
+    faq_extra = _FAQ_EXTRA_TPL.format(
+        date_display=date_display, puzzle_num=puzzle_num, first_letter=first_letter,
+        word_length=word_length, letters_plural="s" if word_length > 1 else "",
+    )
+    if definition:
+        faq_extra += _FAQ_DEF_TPL.format(date_display=date_display, safe_def=definition.replace('"', "'"))
+
+    ctx = {
+        "CEMANTIX_SITE_URL": CEMANTIX_SITE_URL,
+        "date_str": date_str,
+        "date_display": date_display,
+        "puzzle_num": puzzle_num,
+        "word": word,
+        "faq_extra": faq_extra,
+        "link_prev": f'<link rel="prev" href="{prev_date.isoformat()}">' if prev_date else "",
+        "link_next": f'<link rel="next" href="{next_date.isoformat()}">' if next_date else "",
+        "nav_prev": nav_prev,
+        "nav_next": nav_next,
+        "word_hints_card": word_hints_card,
+        "hints_l1": hints_l1 or _NO_HINTS_HTML,
+        "hints_l2": hints_l2 or _NO_HINTS_HTML,
+        "hints_l3": hints_l3 or _NO_HINTS_HTML,
+    }
+    atomic_write_iter(CEMANTIX_ARCHIVE / f"{date_str}.html",
+                      _render_page(ctx, _ARCHIVE_HEAD_TPL, _ARCHIVE_BODY_TPL), fsync)
+
+
+def generate_archive_index(entries: list[dict]) -> None:
+    """Génère docs/cemantix/archive/index.html — liste de toutes les solutions."""
+    CEMANTIX_ARCHIVE.mkdir(parents=True, exist_ok=True)
+
+    # Liste en compréhension (et non générateur) : join connaît la taille d'avance
+    items_html = "\n".join([
+        f'      <li class="arch-item">'
+        f'<span class="arch-date">{e["_date_fr"]}</span>'
+        f'<span class="arch-num">#{e["puzzle_num"]}</span>'
+        f'<a class="arch-link" href="{e["date"]}">{e["word"].upper()}</a>'
+        f'</li>'
+        for e in entries
+    ])
+    count = len(entries)
+
+    html = f"""<!DOCTYPE html>
+<html lang="fr">
+<head>
+  <meta charset="UTF-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1.0">
+  <link rel="icon" href="/favicon.svg" type="image/svg+xml">
+
+  <title>Archives Cémantix — Toutes les solutions du jour</title>
+  <meta name="description" content="Retrouvez toutes les solutions passées de Cémantix : réponses et indices de chaque puzzle depuis le début.">
+  <meta name="robots" content="index, follow">
+  <link rel="canonical" href="{CEMANTIX_SITE_URL}/archive/">
+  <meta name="google-site-verification" content="KLhfwprI4hatb7c2RyrwsiYjulATuj0vJueDdJt0yLs">
+
+  <meta property="og:title" content="Archives Cémantix — Toutes les solutions">
+  <meta property="og:description" content="Toutes les solutions passées du jeu Cémantix avec indices progressifs.">
+  <meta property="og:type" content="website">
+  <meta property="og:url" content="{CEMANTIX_SITE_URL}/archive/">
+  <meta property="og:locale" content="fr_FR">
+  <meta property="og:site_name" content="Solutions du Jour">
+
+  <script type="application/ld+json">
+  {{
+    "@context": "https://schema.org",
+    "@type": "BreadcrumbList",
+    "itemListElement": [
+      {{"@type": "ListItem", "position": 1, "name": "Accueil", "item": "{SITE_URL}/"}},
+      {{"@type": "ListItem", "position": 2, "name": "Cémantix", "item": "{CEMANTIX_SITE_URL}/"}},
+      {{"@type": "ListItem", "position": 3, "name": "Archives"}}
+    ]
+  }}
+  </script>
+
+  <link rel="stylesheet" href="../../css/style.css">
+  <script data-goatcounter="https://j0hanj0han.goatcounter.com/count"
+          async src="https://gc.zgo.at/count.js"></script>
+</head>
+<body>
+
+<header class="site-header">
+  <h1>Archives Cémantix</h1>
+  <p class="subtitle">{count} solution{"s" if count > 1 else ""} enregistrée{"s" if count > 1 else ""}</p>
+</header>
+
+<main>
+<nav class="breadcrumb" aria-label="Fil d'Ariane">
+  <a href="{SITE_URL}/">Accueil</a> &rsaquo;
+  <a href="../">Cémantix</a> &rsaquo;
+  <span>Archives</span>
+</nav>
+  <div class="card">
+    <h2>Toutes les solutions Cémantix ({count})</h2>
+    <p style="font-size:.9rem;color:#6b7280;margin-bottom:1rem;">
+      Cliquez sur un mot pour voir la solution complète et les indices de ce jour.
+    </p>
+    <ul class="arch-list">
+{items_html}
+    </ul>
+  </div>
+
+  <div style="text-align:center;margin-top:.5rem;">
+    <a class="reveal-btn" href="../">Solution du jour &#8594;</a>
+  </div>
+</main>
+
+<footer>
+  <p>
+    <a href="../">Solution du jour</a> ·
+    <a href="https://cemantix.certitudes.org" rel="noopener" target="_blank">Jouer à Cémantix</a>
+  </p>
+  <p style="margin-top:.4rem;">Site non officiel — Solution générée automatiquement</p>
+</footer>
+
+</body>
+</html>"""
+
+    atomic_write(CEMANTIX_ARCHIVE / "index.html", html)
+
+
+def generate_index_html(
+    today: date,
+    puzzle_num: int,
+    word: str,
+    hints: dict,
+    definition: str = "",
+    recent_archives: list | None = None,
+) -> None:
+    """Génère docs/cemantix/index.html."""
+    date_str = today.isoformat()
+    date_display = date_fr(today)
+    hints_l1, hints_l2, hints_l3 = _hints_html(hints)
+    word_hints_card = _word_hints_card_html(word, definition)
+    first_letter = word[0].upper() if word else "?"
+    word_length = len(word)
+    faq_extra = _FAQ_EXTRA_TPL.format(
+        date_display=date_display, puzzle_num=puzzle_num, first_letter=first_letter,
+        word_length=word_length, letters_plural="s" if word_length > 1 else "",
+    )
+    if definition:
+        faq_extra += _FAQ_DEF_TPL.format(date_display=date_display, safe_def=definition.replace('"', "'"))
+
+    recent_archives_card = ""
+    if recent_archives:
+        items = "\n".join([
+            f'      <li class="arch-item">'
+            f'<span class="arch-date">{e["_date_fr"]}</span>'
+            f'<span class="arch-num">#{e["puzzle_num"]}</span>'
+            f'<a class="arch-link" href="archive/{e["date"]}">{e["word"].upper()}</a>'
+            f'</li>'
+            for e in recent_archives[:7]
+        ])
+        recent_archives_card = f"""
+    <div class="card">
+      <h2>Solutions précédentes</h2>
+      <ul class="arch-list">
+{items}
+      </ul>
+      <p style="margin-top:.75rem;font-size:.9rem;">
+        <a href="archive/">Voir toutes les archives &#8594;</a>
+      </p>
+    </div>"""
+
+    ctx = {
+        "SITE_URL": SITE_URL,
+        "CEMANTIX_SITE_URL": CEMANTIX_SITE_URL,
+        "date_str": date_str,
+        "date_display": date_display,
+        "puzzle_num": puzzle_num,
+        "word": word,
+        "faq_extra": faq_extra,
+        "word_hints_card": word_hints_card,
+        "hints_l1": hints_l1 or _NO_HINTS_HTML,
+        "hints_l2": hints_l2 or _NO_HINTS_HTML,
+        "hints_l3": hints_l3 or _NO_HINTS_HTML,
+        "recent_archives_card": recent_archives_card,
+    }
+    atomic_write_iter(CEMANTIX_DIR / "index.html", _render_page(ctx, _INDEX_HEAD_TPL, _INDEX_BODY_TPL))
 
 
 # ── Orchestration HTML ────────────────────────────────────────────────────────
 
-def _generate_all_html(today: date, puzzle_num: int, word: str, hints: dict, definition: str = "") -> None:
+def _generate_all_html(
+    today: date,
+    puzzle_num: int,
+    word: str,
+    hints: dict,
+    definition: str = "",
+    all_archives: list[dict] | None = None,
+) -> None:
     """
     Génère tous les fichiers HTML Cémantix à partir des JSON déjà en place.
+    all_archives : archives déjà chargées (sinon lues ici).
     """
-    all_archives = load_all_archives()
+    if all_archives is None:
+        all_archives = load_all_archives()
     today_str = today.isoformat()
     past_archives = [e for e in all_archives if e["date"] != today_str]
 
     print(f"[Cémantix] Génération des pages HTML d'archive ({len(past_archives)} pages)…")
+    # Une page n'est réécrite que si ses entrées (ou le code) ont changé depuis le
+    # dernier passage : en pratique, la nouvelle archive et sa voisine.
+    manifest_path = CEMANTIX_ARCHIVE / PAGE_MANIFEST_NAME
+    manifest = load_manifest(manifest_path)
+    new_manifest = {}
+    code = code_key(__file__)
+    # Un seul parcours du dossier au lieu d'un stat() par page
+    with os.scandir(CEMANTIX_ARCHIVE) as it:
+        html_names = {de.name for de in it if de.name.endswith(".html")}
+    todo = []
     for i, entry in enumerate(past_archives):
-        d = date.fromisoformat(entry["date"])
-        prev_date = date.fromisoformat(past_archives[i + 1]["date"]) if i + 1 < len(past_archives) else None
-        next_date = date.fromisoformat(past_archives[i - 1]["date"]) if i > 0 else None
+        d = entry["_date"]
+        prev_date = past_archives[i + 1]["_date"] if i + 1 < len(past_archives) else None
+        next_date = past_archives[i - 1]["_date"] if i > 0 else None
         entry_hints = entry.get("hints", {"level1": [], "level2": [], "level3": []})
         entry_definition = entry.get("definition", "")
-        generate_archive_html(d, entry["puzzle_num"], entry["word"], entry_hints, prev_date, next_date, entry_definition)
+        key = page_key(code, entry["puzzle_num"], entry["word"], entry_hints, prev_date, next_date, entry_definition)
+        new_manifest[entry["date"]] = key
+        if manifest.get(entry["date"]) == key and f"{entry['date']}.html" in html_names:
+            continue
+        todo.append((d, entry["puzzle_num"], entry["word"], entry_hints, prev_date, next_date, entry_definition))
+    if todo:
+        # Pages indépendantes : écritures réparties sur un pool de threads (I/O bound)
+        with ThreadPoolExecutor(max_workers=min(32, len(todo))) as pool:
+            futures = [pool.submit(generate_archive_html, *args, fsync=False) for args in todo]
+            for fut in as_completed(futures):
+                fut.result()  # propage la première erreur, comme la boucle séquentielle
+        sync_dir(CEMANTIX_ARCHIVE)  # un seul fsync pour tout le lot
+        html_names.update(f"{args[0].isoformat()}.html" for args in todo)
+    if new_manifest != manifest:
+        save_manifest(manifest_path, new_manifest)
+    print(f"[Cémantix]    {len(todo)} page(s) réécrite(s)")
 
     print("[Cémantix] Génération de docs/cemantix/archive/index.html…")
     generate_archive_index(past_archives)
 
-    recent_archives = [e for e in past_archives[:7] if (CEMANTIX_ARCHIVE / f"{e['date']}.html").exists()]
+    recent_archives = [e for e in past_archives[:7] if f"{e['date']}.html" in html_names]
     print("[Cémantix] Génération de docs/cemantix/index.html…")
     generate_index_html(today, puzzle_num, word, hints, definition, recent_archives)
 
 
+# ── Sentinelle de génération ──────────────────────────────────────────────────
+# docs/cemantix/.last_built : empreinte (code, données du jour, mtimes) du dernier
+# rendu complet. Relance le même jour sans changement → aucune page recalculée.
+
+_LAST_BUILT_PATH = CEMANTIX_DIR / ".last_built"
+
+
+def _build_key(data: dict) -> str | None:
+    try:
+        archive_mtime = CEMANTIX_ARCHIVE.stat().st_mtime_ns
+        index_mtime = (CEMANTIX_DIR / "index.html").stat().st_mtime_ns
+        if not (CEMANTIX_ARCHIVE / "index.html").exists():
+            return None
+    except OSError:
+        return None
+    return page_key(code_key(__file__), data, archive_mtime, index_mtime)
+
+
+def _read_last_built() -> str | None:
+    try:
+        return _LAST_BUILT_PATH.read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def _write_last_built(key: str | None) -> None:
+    if key is None:
+        return
+    try:
+        _LAST_BUILT_PATH.write_text(key, encoding="utf-8")
+    except OSError:
+        pass  # cache facultatif
+
+
+# ── Modèle word2vec ───────────────────────────────────────────────────────────
+
+def _load_model_async(model_path: str) -> Future:
+    """Charge le modèle word2vec dans un thread démon, qui ne retarde pas la
+    sortie du processus si le solveur n'est finalement pas lancé.
+    Les erreurs (y compris SystemExit) ressortent via Future.result().
+    """
+    from games.solver import load_model
+    future: Future = Future()
+
+    def _target() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(load_model(model_path))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=_target, name="load-model", daemon=True).start()
+    return future
+
+
 # ── Point d'entrée ────────────────────────────────────────────────────────────
 
 def run(today: date, model_path: str, forced_puzzle: int | None = None) -> dict | None:
@@ -1018,10 +1102,13 @@ def run(today: date, model_path: str, forced_puzzle: int | None = None) -> dict
     # Vérifier si la solution est déjà générée pour aujourd'hui
     solution_path = CEMANTIX_DIR / "solution.json"
     if solution_path.exists():
-        existing = json.loads(solution_path.read_text(encoding="utf-8"))
+        raw = solution_path.read_bytes()
+        existing = json_loads(raw)
         if existing.get("date") == today.isoformat() and existing.get("word"):
             word = existing["word"]
-            puzzle_num = existing.get("puzzle_num", forced_puzzle or get_puzzle_number())
+            # Pas d'appel réseau si le numéro est déjà dans solution.json
+            # (la valeur par défaut de dict.get serait évaluée à chaque fois)
+            puzzle_num = existing.get("puzzle_num") or forced_puzzle or get_puzzle_number()
             hints = existing.get("hints", {"level1": [], "level2": [], "level3": []})
             definition = existing.get("definition", "")
             # Enrichir les définitions des mots-indices si absentes
@@ -1031,31 +1118,60 @@ def run(today: date, model_path: str, forced_puzzle: int | None = None) -> dict
                 for lvl in updated.values() for i in lvl
             ):
                 existing["hints"] = updated
-                atomic_write(solution_path, json.dumps(existing, ensure_ascii=False, indent=2))
+                raw = json_dumps_pretty(existing)
+                atomic_write(solution_path, raw)
             print(f"[Cémantix] ℹ Solution déjà présente : {word!r} — régénération HTML uniquement.")
-            generate_archive_json(today, existing)
+            # L'archive du jour est une copie de solution.json
+            generate_archive_json(today, existing, raw)
+            if _build_key(existing) == _read_last_built():
+                print("[Cémantix] ℹ Pages déjà à jour — rien à régénérer.")
+                return existing
             _generate_all_html(today, puzzle_num, word, updated, definition)
+            _write_last_built(_build_key(existing))
             return existing
 
-    # Numéro du puzzle
+    # En tâche de fond, pendant la récupération du numéro et la résolution :
+    # lecture des archives (l'entrée du jour, écrite entre-temps, est écartée)
+    from games.solver import solve
+    pool = ThreadPoolExecutor(max_workers=1)
+    archives = pool.submit(load_all_archives)
+    pool.shutdown(wait=False)
+
+    # Numéro du puzzle. Le chargement du modèle (disque) n'est lancé que si le
+    # solveur peut tourner : un puzzle forcé est d'abord cherché dans les
+    # archives ; sinon il est recouvert par l'appel réseau.
+    model = None
     if forced_puzzle:
         puzzle_num = forced_puzzle
         print(f"[Cémantix] Puzzle forcé : #{puzzle_num}")
     else:
+        model = _load_model_async(model_path)
         print("[Cémantix] Récupération du numéro du puzzle…")
         puzzle_num = get_puzzle_number()
         print(f"[Cémantix] Puzzle du jour : #{puzzle_num}")
 
-    # Résolution via solver.py
-    print(f"[Cémantix] Résolution du puzzle #{puzzle_num}…")
-    from games.solver import solve
-    word, tried = solve(puzzle_num, model_path)
+    # Puzzle déjà résolu un autre jour (relance avec --puzzle) : le mot est
+    # dans les archives, inutile de relancer le solveur
+    known = next((e for e in archives.result() if e["puzzle_num"] == puzzle_num), None)
+    if known is not None:
+        word, tried_count = known["word"], known.get("tried_count", 0)
+        print(f"[Cémantix] ℹ Puzzle #{puzzle_num} déjà résolu (archive du {known['date']}) : {word!r}")
+        if model is not None and model.done() and model.exception():
+            print(f"[Cémantix] ⚠ Chargement du modèle en échec : {model.exception()!r}")
+    else:
+        # Résolution via solver.py
+        print(f"[Cémantix] Résolution du puzzle #{puzzle_num}…")
+        if model is None:
+            model = _load_model_async(model_path)
+        model.result()  # modèle chargé : solve() le reprend depuis le cache de load_model
+        word, tried = solve(puzzle_num, model_path)
 
-    if not word:
-        print("[Cémantix] ❌ Le solveur n'a pas trouvé la solution.")
-        return None
+        if not word:
+            print("[Cémantix] ❌ Le solveur n'a pas trouvé la solution.")
+            return None
 
-    print(f"[Cémantix] ✅ Solution : {word!r} ({len(tried)} mots testés)")
+        tried_count = len(tried)
+        print(f"[Cémantix] ✅ Solution : {word!r} ({tried_count} mots testés)")
 
     # Voisins et indices
     print("[Cémantix] Récupération des voisins via /nearby…")
@@ -1080,11 +1196,13 @@ def run(today: date, model_path: str, forced_puzzle: int | None = None) -> dict
         print("[Cémantix]    Aucune définition trouvée.")
 
     # Fichiers JSON
-    data = generate_solution_json(today, puzzle_num, word, hints, len(tried), definition)
-    generate_archive_json(today, data)
+    data = generate_solution_json(today, puzzle_num, word, hints, tried_count, definition)
+    # L'archive du jour est une copie de solution.json (fichier à peine écrit, en cache)
+    generate_archive_json(today, data, (CEMANTIX_DIR / "solution.json").read_bytes())
 
     # HTML
-    _generate_all_html(today, puzzle_num, word, hints, definition)
+    _generate_all_html(today, puzzle_num, word, hints, definition, archives.result())
+    _write_last_built(_build_key(data))
 
     print(f"[Cémantix] 🎉 Site généré ({today.isoformat()}, #{puzzle_num}, {word!r})")
     return data
@@ -27,7 +27,7 @@ from pathlib import Path
 from bs4 import BeautifulSoup
 
 from core import (
-    SITE_URL, DOCS_DIR, _session, date_fr, atomic_write,
+    SITE_URL, DOCS_DIR, get_session, date_fr, atomic_write,
     fetch_static_html, jackpot_html,
     load_all_archives as _load_archives,
 )
@@ -62,7 +62,7 @@ def get_euromillions_latest() -> dict | None:
     Les boules et étoiles sont triées par ordre croissant.
     """
     try:
-        resp = _session.get(_EM_RESULTS_URL, headers=_HEADERS, timeout=15)
+        resp = get_session().get(_EM_RESULTS_URL, headers=_HEADERS, timeout=15)
         resp.raise_for_status()
     except Exception as e:
         print(f"   ⚠ EuroMillions : erreur réseau : {e}")
@@ -847,7 +847,7 @@ def fetch_jackpot_data() -> dict:
     Retourne {date_str: {jackpot_amount, jackpot_winners, jackpot_won}}.
     """
     try:
-        resp = _session.get(_PEDRO_API, timeout=30)
+        resp = get_session().get(_PEDRO_API, timeout=30)
         resp.raise_for_status()
     except Exception as e:
         print(f"   ⚠ pedro-mealha jackpot : {e}")
@@ -963,7 +963,7 @@ def backfill_euromillions() -> int:
     # ── Phase 2 : gap via API pedro-mealha ──
     print(f"   → API pedro-mealha (après {max_fdj_date})…", end=" ", flush=True)
     try:
-        resp = _session.get(_PEDRO_API, timeout=30)
+        resp = get_session().get(_PEDRO_API, timeout=30)
         resp.raise_for_status()
         draws = resp.json()
     except Exception as e:
@@ -1456,10 +1456,12 @@ def _generate_all_html(draw_date: date, data: dict) -> None:
     past_archives = [e for e in all_archives if e["date"] != draw_str]
 
     print(f"[EuroMillions] Génération des pages HTML d'archive ({len(past_archives)} pages)…")
+    # Chaque date n'est convertie qu'une fois (elle sert aussi de prev/next aux voisines)
+    dates = [date.fromisoformat(e["date"]) for e in past_archives]
     for i, entry in enumerate(past_archives):
-        d = date.fromisoformat(entry["date"])
-        prev_date = date.fromisoformat(past_archives[i + 1]["date"]) if i + 1 < len(past_archives) else None
-        next_date = date.fromisoformat(past_archives[i - 1]["date"]) if i > 0 else None
+        d = dates[i]
+        prev_date = dates[i + 1] if i + 1 < len(dates) else None
+        next_date = dates[i - 1] if i > 0 else None
         generate_archive_html(
             d, entry["balls"], entry["stars"], prev_date, next_date,
             jackpot_amount=entry.get("jackpot_amount"),
@@ -1582,7 +1584,7 @@ def run(today: date) -> dict | None:
 
 def generate_simulator_data() -> None:
     """Génère docs/euromillions/simulateur/data.json — tous tirages [date, balls, stars]."""
-    archives = _load_archives(EM_ARCHIVE, required_keys=["date", "balls", "stars"])
+    archives = _load_archives(EM_ARCHIVE, required_keys=["date", "balls", "stars"], slim=True)
     if not archives:
         print("[EuroMillions] ⚠ Simulateur : aucune archive trouvée")
         return
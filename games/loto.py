@@ -22,7 +22,7 @@ from pathlib import Path
 from bs4 import BeautifulSoup
 
 from core import (
-    SITE_URL, DOCS_DIR, _session, date_fr, atomic_write,
+    SITE_URL, DOCS_DIR, get_session, date_fr, atomic_write,
     fetch_static_html, jackpot_html,
     load_all_archives as _load_archives,
 )
@@ -57,7 +57,7 @@ def backfill_archives() -> int:
             "?dataset=resultats-loto-2019-a-aujourd-hui%40agrall"
             f"&rows={batch}&start={start}&sort=date_de_tirage"
         )
-        resp = _session.get(url, timeout=15)
+        resp = get_session().get(url, timeout=15)
         resp.raise_for_status()
         records = resp.json().get("records", [])
         if not records:
@@ -94,7 +94,7 @@ def get_loto_latest() -> dict | None:
     Les boules sont triées par ordre croissant (comme l'affichage officiel FDJ).
     """
     try:
-        resp = _session.get(_LOTO_API, timeout=15)
+        resp = get_session().get(_LOTO_API, timeout=15)
         resp.raise_for_status()
         records = resp.json().get("records", [])
         if not records:
@@ -253,7 +253,7 @@ def get_loto_from_tirage_gagnant() -> dict | None:
 def get_loto_jackpot_latest(nb: int = 50) -> dict[str, dict]:
     """Récupère les infos jackpot des N derniers tirages depuis reducmiz.com."""
     try:
-        resp = _session.get(_REDUCMIZ_URL.format(nb=nb), timeout=20)
+        resp = get_session().get(_REDUCMIZ_URL.format(nb=nb), timeout=20)
         resp.raise_for_status()
         soup = BeautifulSoup(resp.text, "html.parser")
         return _parse_reducmiz_jackpot(soup.get_text(separator="\n", strip=True))
@@ -1387,10 +1387,12 @@ def _generate_all_html(draw_date: date, data: dict) -> None:
     past_archives = [e for e in all_archives if e["date"] != draw_str]
 
     print(f"[Loto] Génération des pages HTML d'archive ({len(past_archives)} pages)…")
+    # Chaque date n'est convertie qu'une fois (elle sert aussi de prev/next aux voisines)
+    dates = [date.fromisoformat(e["date"]) for e in past_archives]
     for i, entry in enumerate(past_archives):
-        d = date.fromisoformat(entry["date"])
-        prev_date = date.fromisoformat(past_archives[i + 1]["date"]) if i + 1 < len(past_archives) else None
-        next_date = date.fromisoformat(past_archives[i - 1]["date"]) if i > 0 else None
+        d = dates[i]
+        prev_date = dates[i + 1] if i + 1 < len(dates) else None
+        next_date = dates[i - 1] if i > 0 else None
         generate_archive_html(
             d, entry.get("draw_num", ""), entry["balls"], entry["lucky_ball"],
             prev_date, next_date,
@@ -1505,7 +1507,7 @@ def run(today: date) -> dict | None:
 
 def generate_simulator_data() -> None:
     """Génère docs/loto/simulateur/data.json — tous tirages [date, balls, lucky_ball]."""
-    archives = _load_archives(LOTO_ARCHIVE, required_keys=["date", "balls", "lucky_ball"])
+    archives = _load_archives(LOTO_ARCHIVE, required_keys=["date", "balls", "lucky_ball"], slim=True)
     if not archives:
         print("[Loto] ⚠ Simulateur : aucune archive trouvée")
         return
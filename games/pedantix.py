@@ -15,7 +15,7 @@ from datetime import date, datetime, timedelta, timezone
 from html import escape as _html_escape
 from pathlib import Path
 
-from core import SITE_URL, DOCS_DIR, _session, date_fr, atomic_write, load_all_archives as _load_archives
+from core import SITE_URL, DOCS_DIR, get_session, date_fr, atomic_write, load_all_archives as _load_archives
 
 # ── Configuration Pédantix ────────────────────────────────────────────────────
 
@@ -53,7 +53,7 @@ def get_page_info() -> tuple[int, str | None, str | None]:
     puzzle_num = _REF_PUZZLE + (date.today() - _REF_DATE).days
     yesterday_slug = yesterday_name = None
     try:
-        resp = _session.get(BASE_URL, headers=_HEADERS_FORM, timeout=10)
+        resp = get_session().get(BASE_URL, headers=_HEADERS_FORM, timeout=10)
         soup = BeautifulSoup(resp.text, "html.parser")
         script = soup.find("script", id="script")
         if script and "data-puzzle-number" in script.attrs:
@@ -78,7 +78,7 @@ def get_puzzle_number() -> int:
 def _score_candidate(word: str, puzzle_num: int) -> dict | None:
     time.sleep(0.3)
     try:
-        resp = _session.post(
+        resp = get_session().post(
             f"{BASE_URL}/score?n={puzzle_num}",
             data=json.dumps({"num": puzzle_num, "word": word, "answer": []}),
             headers=_HEADERS_JSON,
@@ -92,7 +92,7 @@ def _score_candidate(word: str, puzzle_num: int) -> dict | None:
 
 def _get_page(article_slug: str) -> dict | None:
     try:
-        resp = _session.post(
+        resp = get_session().post(
             f"{BASE_URL}/page",
             data=f"answer={article_slug}",
             headers=_HEADERS_FORM,
@@ -109,7 +109,7 @@ def fetch_wikipedia_data(slug: str) -> tuple[str, list[str]]:
     extract = ""
     categories = []
     try:
-        resp = _session.get(
+        resp = get_session().get(
             f"https://fr.wikipedia.org/api/rest_v1/page/summary/{slug}",
             timeout=10,
         )
@@ -129,7 +129,7 @@ def fetch_wikipedia_data(slug: str) -> tuple[str, list[str]]:
     # Catégories via parse (moins de maintenance que query/categories)
     if len(categories) < 3:
         try:
-            resp2 = _session.get(
+            resp2 = get_session().get(
                 f"https://fr.wikipedia.org/w/api.php?action=parse&page={slug}"
                 f"&prop=categories&format=json",
                 timeout=10,
@@ -165,7 +165,7 @@ def fetch_history() -> list[tuple[int, str, str]]:
     Le puzzle actif retourne ['', ''] et est filtré.
     """
     try:
-        resp = _session.get(f"{BASE_URL}/history", timeout=10)
+        resp = get_session().get(f"{BASE_URL}/history", timeout=10)
         if resp.status_code == 200:
             raw = resp.json()
             result = []
@@ -239,10 +239,11 @@ def build_hints(title_display: str, title_slug: str) -> dict:
 
 # ── Chargement des archives ───────────────────────────────────────────────────
 
-def load_all_archives() -> list[dict]:
+def load_all_archives(limit: int | None = None) -> list[dict]:
     return _load_archives(
         PEDANTIX_ARCHIVE,
         required_keys=["date", "word", "puzzle_num"],
+        limit=limit,
     )
 
 
@@ -973,10 +974,12 @@ def _generate_all_html(
     past_archives = [e for e in all_archives if e["date"] != today_str]
 
     print(f"[Pédantix] Génération des pages HTML d'archive ({len(past_archives)} pages)…")
+    # Chaque date n'est convertie qu'une fois (elle sert aussi de prev/next aux voisines)
+    dates = [date.fromisoformat(e["date"]) for e in past_archives]
     for i, entry in enumerate(past_archives):
-        d = date.fromisoformat(entry["date"])
-        prev_date = date.fromisoformat(past_archives[i + 1]["date"]) if i + 1 < len(past_archives) else None
-        next_date = date.fromisoformat(past_archives[i - 1]["date"]) if i > 0 else None
+        d = dates[i]
+        prev_date = dates[i + 1] if i + 1 < len(dates) else None
+        next_date = dates[i - 1] if i > 0 else None
         e_title = entry.get("title_display") or entry.get("word", "?")
         e_slug = entry.get("title_slug", e_title)
         e_hints = entry.get("hints", {"level1": [], "level2": [], "level3": []})
@@ -1114,9 +1117,9 @@ def run(today: date) -> dict | None:
     if not title_display:
         # /history ne révèle pas encore le puzzle actif — utiliser la dernière archive connue
         print("[Pédantix] ⏳ Solution du jour non disponible dans /history (puzzle actif).")
-        all_archives = load_all_archives()
-        if all_archives:
-            latest = all_archives[0]  # archives triées DESC
+        latest_archives = load_all_archives(limit=1)
+        if latest_archives:
+            latest = latest_archives[0]  # archives triées DESC
             title_display = latest.get("title_display") or latest.get("word", "")
             title_slug = latest.get("title_slug", title_display)
             hints = latest.get("hints", {"level1": [], "level2": [], "level3": []})
@@ -11,7 +11,7 @@ Algorithme :
 Suppose que le modèle local est identique au modèle du serveur.
 
 Prérequis :
-  pip install requests gensim numpy beautifulsoup4
+  pip install requests cloudscraper gensim numpy
   Modèle : frWac_non_lem_no_postag_no_phrase_200_cbow_cut100.bin (120 Mo)
     → https://embeddings.net/embeddings/frWac_non_lem_no_postag_no_phrase_200_cbow_cut100.bin
 
@@ -22,16 +22,29 @@ Lancement :
 """
 
 import argparse
+import json
+import os
+import re
 import sys
+import threading
 import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
 
 import numpy as np
-from bs4 import BeautifulSoup
 
-from core import _session
+from core import get_session, json_loads, atomic_write
 
 BASE_URL = "https://cemantix.certitudes.org"
 SIMILARITY_THRESHOLD = 0.1  # seuil cosinus minimum pour soumettre un candidat local
+PROBE_WORKERS = 4           # requêtes /score en vol simultanément
+PROBE_INTERVAL = 0.2        # écart minimum (s) entre deux envois /score, tous threads confondus
+# Scores déjà obtenus pour le puzzle en cours : une relance (ex. nouvelle tentative
+# de run_daily.sh) rejoue ces probes sans les redemander à l'API
+PROBE_CACHE_PATH = Path(".cache") / "solver-probes.json"
 HEADERS = {
     "Content-Type": "application/x-www-form-urlencoded",
     "Origin": BASE_URL,
@@ -46,41 +59,139 @@ SEEDS = [
     "roi", "dieu", "soleil", "rêve", "silence",
 ]
 
+# Balise <script id="script" data-puzzle-number="…"> (même lecture que games/cemantix.py)
+_SCRIPT_TAG_RE = re.compile(rb'<script\b[^>]*\sid=["\']script["\'][^>]*>')
+_PUZZLE_NUM_RE = re.compile(rb'\sdata-puzzle-number=["\'](\d+)["\']')
+
 
 # ── API ────────────────────────────────────────────────────────────────────────
 
 def get_puzzle_number() -> int:
-    resp = _session.get(BASE_URL, headers=HEADERS, timeout=10)
-    soup = BeautifulSoup(resp.text, "html.parser")
-    script = soup.find("script", id="script")
-    if not script:
+    resp = get_session().get(BASE_URL, headers=HEADERS, timeout=10)
+    tag = _SCRIPT_TAG_RE.search(resp.content)
+    m = _PUZZLE_NUM_RE.search(tag.group()) if tag else None
+    if not m:
         raise RuntimeError("Impossible de trouver le numéro du puzzle.")
-    return int(script["data-puzzle-number"])
+    return int(m.group(1))
 
 
 api_calls = 0
-
-
-def score_word(word: str, puzzle_num: int, delay: float = 0.2) -> dict | None:
-    """Retourne {"s": cosine_sim, "p": percentile} ou None si mot inconnu/rate-limit."""
+_api_lock = threading.Lock()
+_next_call = 0.0  # instant (time.monotonic) du prochain envoi autorisé
+
+
+def _throttle(interval: float) -> None:
+    """Réserve le prochain créneau d'envoi et attend qu'il arrive.
+    Seul le reste de l'intervalle est attendu : le temps de réponse du serveur
+    compte déjà, et des requêtes en vol ne décalent pas le rythme d'envoi."""
+    global _next_call
+    with _api_lock:
+        now = time.monotonic()
+        start = max(now, _next_call)
+        _next_call = start + interval
+    if start > now:
+        time.sleep(start - now)
+
+
+def score_word(
+    word: str, puzzle_num: int, delay: float = PROBE_INTERVAL,
+    stop: threading.Event | None = None,
+) -> dict | None:
+    """Retourne {"s": cosine_sim, "p": percentile} ou None si mot inconnu/rate-limit.
+    stop : si levé pendant l'attente du créneau d'envoi, la requête ne part pas.
+    """
     global api_calls
-    time.sleep(delay)
+    if stop is not None and stop.is_set():
+        return None
+    _throttle(delay)
+    if stop is not None and stop.is_set():
+        return None
     try:
-        resp = _session.post(
+        resp = get_session().post(
             f"{BASE_URL}/score?n={puzzle_num}",
             data=f"word={word}",
             headers=HEADERS,
             timeout=10,
         )
-        data = resp.json()
+        data = json_loads(resp.content)  # bytes → orjson si disponible
         if "s" in data:
-            api_calls += 1
+            with _api_lock:
+                api_calls += 1
             return data
         return None
     except Exception:
         return None
 
 
+def _score_cached(
+    word: str, puzzle_num: int, scores: dict, stop: threading.Event | None = None,
+) -> dict | None:
+    """score_word, sauf si le mot a déjà été scoré pour ce puzzle."""
+    result = scores.get(word)
+    if result is None:
+        result = score_word(word, puzzle_num, stop=stop)
+        if result is not None:
+            scores[word] = result
+    return result
+
+
+def probe_all(
+    words: Iterable[str], puzzle_num: int, scores: dict | None = None,
+) -> Iterator[tuple[str, dict | None]]:
+    """
+    Score les mots avec jusqu'à PROBE_WORKERS requêtes en vol (le débit reste
+    plafonné par _throttle) : les allers-retours réseau se recouvrent.
+    Produit (mot, résultat de score_word) dans l'ordre des mots. Si l'appelant
+    s'arrête (mot trouvé), les requêtes pas encore parties sont annulées ; celles
+    déjà en vol sont attendues, et leurs scores vont dans `scores` (donc au cache).
+    scores : {mot: résultat} déjà connus (lus et complétés, voir load_probe_cache).
+    """
+    if scores is None:
+        scores = {}
+    it = iter(words)
+    stop = threading.Event()
+    pool = ThreadPoolExecutor(max_workers=PROBE_WORKERS)
+    try:
+        window = deque()
+        for word in it:
+            window.append((word, pool.submit(_score_cached, word, puzzle_num, scores, stop)))
+            if len(window) == PROBE_WORKERS:
+                break
+        while window:
+            word, future = window.popleft()
+            nxt = next(it, None)
+            if nxt is not None:
+                window.append((nxt, pool.submit(_score_cached, nxt, puzzle_num, scores, stop)))
+            yield word, future.result()
+    finally:
+        stop.set()
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def load_probe_cache(puzzle_num: int) -> dict:
+    """Scores mis en cache pour ce puzzle ({} si absent ou d'un autre puzzle)."""
+    try:
+        cache = json_loads(PROBE_CACHE_PATH.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("puzzle_num") != puzzle_num:
+        return {}
+    return cache.get("scores") or {}
+
+
+def save_probe_cache(puzzle_num: int, scores: dict) -> None:
+    """Un seul puzzle conservé : le fichier ne grossit pas d'un jour à l'autre."""
+    if not scores:
+        return
+    try:
+        PROBE_CACHE_PATH.parent.mkdir(exist_ok=True)
+        atomic_write(PROBE_CACHE_PATH, json.dumps(
+            {"puzzle_num": puzzle_num, "scores": scores}, ensure_ascii=False,
+        ), fsync=False)
+    except OSError as e:
+        print(f"   ⚠ Cache des scores non écrit : {e}")
+
+
 # ── Affichage ──────────────────────────────────────────────────────────────────
 
 def emoji_for(s: float, p) -> str:
@@ -99,20 +210,130 @@ def display(word: str, s: float, p, attempt: int):
     print(f"  #{attempt:>3}  {word:<28} {s*100:>7.2f}°C  {p_str}  {emoji_for(s, p)}")
 
 
+# ── Modèle word2vec ────────────────────────────────────────────────────────────
+# Le .bin (format word2vec, ~120 Mo à parser) est converti au premier lancement en
+# <modèle>.vectors.npy + <modèle>.vocab.json, à côté du .bin. Les lancements
+# suivants projettent la matrice en mémoire (mmap) : ni parsing ni copie.
+
+class WordVectors:
+    """Vecteurs de mots : le sous-ensemble de KeyedVectors (gensim) utilisé ici."""
+
+    def __init__(self, vectors: np.ndarray, words: list[str]):
+        self.vectors = vectors
+        self.index_to_key = words
+        self.key_to_index = {w: i for i, w in enumerate(words)}
+        self._inv_norms = None
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.key_to_index
+
+    def __getitem__(self, word: str) -> np.ndarray:
+        return self.vectors[self.key_to_index[word]]
+
+    def similar_by_vector(self, vector: np.ndarray, topn: int = 10) -> list[tuple[str, float]]:
+        """Les topn mots les plus proches du vecteur (cosinus décroissant)."""
+        if self._inv_norms is None:
+            self._inv_norms = 1.0 / np.linalg.norm(self.vectors, axis=1)
+        sims = (self.vectors @ vector) * self._inv_norms / np.linalg.norm(vector)
+        if topn < len(sims):
+            # Sélection O(N) des topn, puis tri de ces seuls topn
+            best = np.argpartition(-sims, topn)[:topn]
+            best = best[np.argsort(-sims[best])]
+        else:
+            best = np.argsort(-sims)
+        return [(self.index_to_key[i], float(sims[i])) for i in best]
+
+
+def _cache_paths(model_path: str) -> tuple[Path, Path]:
+    src = Path(model_path)
+    return src.with_name(src.name + ".vectors.npy"), src.with_name(src.name + ".vocab.json")
+
+
+def _load_cached(model_path: str) -> WordVectors | None:
+    """Modèle depuis le cache .npy/.json, ou None s'il est absent ou périmé."""
+    npy, vocab = _cache_paths(model_path)
+    try:
+        cache_mtime = min(npy.stat().st_mtime_ns, vocab.stat().st_mtime_ns)
+        if cache_mtime < os.stat(model_path).st_mtime_ns:
+            return None  # .bin remplacé depuis la conversion
+        vectors = np.load(npy, mmap_mode="r")
+        words = json_loads(vocab.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if len(words) != len(vectors):
+        return None
+    return WordVectors(vectors, words)
+
+
+def _save_cache(model_path: str, model: WordVectors) -> None:
+    npy, vocab = _cache_paths(model_path)
+    tmp = npy.with_name(npy.name + ".tmp")
+    try:
+        with open(tmp, "wb") as f:
+            np.save(f, model.vectors)
+        os.replace(tmp, npy)
+        # Vocabulaire écrit en dernier : sa date valide la paire
+        atomic_write(vocab, json.dumps(model.index_to_key, ensure_ascii=False))
+    except OSError as e:
+        print(f"   ⚠ Cache du modèle non écrit : {e}")
+
+
+@lru_cache(maxsize=1)
+def load_model(model_path: str) -> WordVectors:
+    """Charge le modèle word2vec (une seule fois par processus)."""
+    print(f"Chargement du modèle : {model_path} …")
+    model = _load_cached(model_path)
+    if model is None:
+        try:
+            from gensim.models import KeyedVectors
+        except ImportError:
+            print("❌  pip install gensim")
+            sys.exit(1)
+        kv = KeyedVectors.load_word2vec_format(model_path, binary=True, unicode_errors="ignore")
+        model = WordVectors(kv.vectors, list(kv.index_to_key))
+        _save_cache(model_path, model)
+    print(f"Vocabulaire : {len(model.key_to_index):,} mots\n")
+    return model
+
+
 # ── Reconstruction ─────────────────────────────────────────────────────────────
 
+def _min_norm_solve(X: np.ndarray, s: np.ndarray) -> np.ndarray:
+    """
+    Même solution que np.linalg.lstsq(X, s) (moindres carrés de norme minimale),
+    par les équations normales : un seul système symétrique de taille min(N, d)
+    au lieu d'une SVD.
+      N ≥ d : (XᵀX) T = Xᵀs
+      N < d : T = Xᵀ y avec (XXᵀ) y = s   (système sous-déterminé)
+    Calcul en float64 (les équations normales élèvent le conditionnement au carré).
+    Repli sur lstsq si le système est singulier (probes colinéaires).
+    """
+    X64 = X.astype(np.float64)
+    s64 = s.astype(np.float64)
+    try:
+        if X64.shape[0] >= X64.shape[1]:
+            T = np.linalg.solve(X64.T @ X64, X64.T @ s64)
+        else:
+            T = X64.T @ np.linalg.solve(X64 @ X64.T, s64)
+    except np.linalg.LinAlgError:
+        T, _, _, _ = np.linalg.lstsq(X64, s64, rcond=None)
+    return T.astype(np.float32)
+
+
 def reconstruct_target(tried: dict[str, float], model) -> np.ndarray | None:
     """
     Estime le vecteur cible T par moindres carrés.
     cosine(embed(w_i), T) ≈ tried[w_i]  →  X · T ≈ s  →  T = X^+ · s
     Plus on a de probes (surtout avec des scores élevés), plus c'est précis.
     """
-    words = [w for w in tried if w in model and tried[w] > -0.5]
-    if len(words) < 5:
+    key_to_index = model.key_to_index
+    probes = [(key_to_index[w], sim) for w, sim in tried.items() if sim > -0.5 and w in key_to_index]
+    if len(probes) < 5:
         return None
-    X = np.array([model[w] for w in words], dtype=np.float32)
-    s = np.array([tried[w] for w in words], dtype=np.float32)
-    T, _, _, _ = np.linalg.lstsq(X, s, rcond=None)
+    rows, sims = zip(*probes)
+    X = model.vectors[list(rows)]  # une seule indexation (copie contiguë) au lieu d'une ligne par mot
+    s = np.array(sims, dtype=np.float32)
+    T = _min_norm_solve(X, s)
     norm = np.linalg.norm(T)
     return T / norm if norm > 1e-9 else None
 
@@ -120,18 +341,20 @@ def reconstruct_target(tried: dict[str, float], model) -> np.ndarray | None:
 # ── Solveur principal ──────────────────────────────────────────────────────────
 
 def solve(puzzle_num: int, model_path: str):
+    scores = load_probe_cache(puzzle_num)
+    try:
+        return _solve(puzzle_num, model_path, scores)
+    finally:
+        save_probe_cache(puzzle_num, scores)  # aussi en cas d'échec ou d'interruption
+
+
+def _solve(puzzle_num: int, model_path: str, scores: dict):
     global api_calls
     api_calls = 0
 
-    try:
-        from gensim.models import KeyedVectors
-    except ImportError:
-        print("❌  pip install gensim")
-        sys.exit(1)
-
-    print(f"Chargement du modèle : {model_path} …")
-    model = KeyedVectors.load_word2vec_format(model_path, binary=True, unicode_errors="ignore")
-    print(f"Vocabulaire : {len(model.key_to_index):,} mots\n")
+    model = load_model(model_path)
+    if scores:
+        print(f"{len(scores)} scores déjà connus pour le puzzle #{puzzle_num} (cache)\n")
 
     tried: dict[str, float] = {}
     attempt = 0
@@ -143,8 +366,7 @@ def solve(puzzle_num: int, model_path: str):
 
     # ── Phase 1 : Seeds ───────────────────────────────────────────────────────
     print(f"🌱 Puzzle #{puzzle_num} — Phase 1 : seeds\n")
-    for word in [w for w in SEEDS if w in model]:
-        result = score_word(word, puzzle_num)
+    for word, result in probe_all([w for w in SEEDS if w in model], puzzle_num, scores):
         if result is None:
             continue
         attempt += 1
@@ -166,10 +388,7 @@ def solve(puzzle_num: int, model_path: str):
         print(f"   {len(candidates)} candidats au-dessus du seuil {SIMILARITY_THRESHOLD} (sur 300)")
         print(f"   Top 5 : {', '.join(w for w, _ in candidates[:5])}\n")
         print(f"🎯 Phase 2b : vérification des candidats locaux …\n")
-        for word, _ in candidates:
-            if word in tried:
-                continue
-            result = score_word(word, puzzle_num)
+        for word, result in probe_all([w for w, _ in candidates if w not in tried], puzzle_num, scores):
             if result is None:
                 continue
             attempt += 1
@@ -203,8 +422,7 @@ def solve(puzzle_num: int, model_path: str):
             break
 
         print(f"  [{iteration+1}] {len(candidates)} candidats locaux\n")
-        for word in candidates:
-            result = score_word(word, puzzle_num)
+        for word, result in probe_all(candidates, puzzle_num, scores):
             if result is None:
                 continue
             attempt += 1
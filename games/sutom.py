@@ -10,11 +10,18 @@ Génère :
 """
 
 import base64
-import json
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
-from core import SITE_URL, DOCS_DIR, _session, date_fr, atomic_write, load_all_archives as _load_archives
+from core import (
+    SITE_URL, DOCS_DIR, PAGE_MANIFEST_NAME, get_session, date_fr, atomic_write, atomic_write_iter,
+    sync_dir, json_dumps_pretty, json_loads, code_key, page_key, load_manifest, save_manifest,
+    load_all_archives as _load_archives,
+)
 
 # ── Configuration Sutom ───────────────────────────────────────────────────────
 
@@ -26,6 +33,20 @@ SUTOM_SITE_URL = f"{SITE_URL}/sutom"
 _SUTOM_PARTIE_ID = "34ccc522-c264-4e51-b293-fd5bd60ef7aa"
 # Date d'origine (source : instanceConfiguration.dateOrigine = new Date(2022, 0, 8))
 _SUTOM_LAUNCH = date(2022, 1, 8)
+# Cache négatif (non versionné) : après un échec, pas de nouvelle requête pendant
+# quelques minutes. TTL < 5 min pour laisser passer la relance de run_daily.sh.
+_UNAVAILABLE_PATH = SUTOM_DIR / ".unavailable"
+_UNAVAILABLE_TTL = 240
+
+_dirs_ready = False
+
+
+def _ensure_dirs() -> None:
+    """Crée docs/sutom/ et docs/sutom/archive/ une seule fois par processus."""
+    global _dirs_ready
+    if not _dirs_ready:
+        SUTOM_ARCHIVE.mkdir(parents=True, exist_ok=True)  # crée aussi SUTOM_DIR
+        _dirs_ready = True
 
 
 # ── API Sutom ─────────────────────────────────────────────────────────────────
@@ -36,11 +57,14 @@ def get_sutom_solution(today: date) -> tuple[str | None, int | None]:
     URL : https://sutom.nocle.fr/mots/{btoa(uuid-YYYY-MM-DD)}.txt
     Retourne (word, puzzle_num) ou (None, None) si indisponible.
     """
-    raw = f"{_SUTOM_PARTIE_ID}-{today.isoformat()}".encode()
-    filename = base64.b64encode(raw).decode()  # padding = conservé (comme btoa JS)
-    url = f"https://sutom.nocle.fr/mots/{filename}.txt"
+    if _recently_unavailable(today):
+        print("   ℹ Sutom : indisponible il y a moins de "
+              f"{_UNAVAILABLE_TTL // 60} min — requête ignorée.")
+        return None, None
+
+    url = f"https://sutom.nocle.fr/mots/{_encode_filename(today.isoformat())}.txt"
     try:
-        resp = _session.get(url, timeout=10)
+        resp = get_session().get(url, timeout=10)
         if resp.status_code == 200 and resp.text.strip():
             word = resp.text.strip().upper()
             puzzle_num = (today - _SUTOM_LAUNCH).days + 1
@@ -48,60 +72,104 @@ def get_sutom_solution(today: date) -> tuple[str | None, int | None]:
     except Exception as e:
         print(f"   ⚠ Sutom : {e}")
 
+    _mark_unavailable(today)
     return None, None
 
 
+@lru_cache(maxsize=4)
+def _encode_filename(iso_date: str) -> str:
+    """btoa(uuid-YYYY-MM-DD) ; relances du même jour = simple lecture du cache."""
+    raw = f"{_SUTOM_PARTIE_ID}-{iso_date}".encode()
+    return base64.b64encode(raw).decode()  # padding = conservé (comme btoa JS)
+
+
+def _recently_unavailable(today: date) -> bool:
+    """Vrai si un échec pour ce jour a été noté il y a moins de _UNAVAILABLE_TTL s."""
+    try:
+        st = _UNAVAILABLE_PATH.stat()
+        if time.time() - st.st_mtime >= _UNAVAILABLE_TTL:
+            return False
+        return _UNAVAILABLE_PATH.read_text(encoding="utf-8") == today.isoformat()
+    except OSError:
+        return False
+
+
+def _mark_unavailable(today: date) -> None:
+    try:
+        _ensure_dirs()
+        _UNAVAILABLE_PATH.write_text(today.isoformat(), encoding="utf-8")
+    except OSError:
+        pass  # cache facultatif
+
+
 # ── Génération des fichiers ───────────────────────────────────────────────────
 
-def generate_solution_json(today: date, puzzle_num: int, word: str) -> dict:
+def generate_solution_json(today: date, puzzle_num: int, word: str,
+                           generated_at: str | None = None) -> dict:
+    if generated_at is None:
+        generated_at = datetime.now(timezone.utc).isoformat()
     data = {
         "date": today.isoformat(),
         "puzzle_num": puzzle_num,
         "word": word,
         "letter_count": len(word),
         "first_letter": word[0] if word else "",
-        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "generated_at": generated_at,
     }
-    SUTOM_DIR.mkdir(parents=True, exist_ok=True)
-    atomic_write(SUTOM_DIR / "solution.json", json.dumps(data, ensure_ascii=False, indent=2))
+    _ensure_dirs()
+    atomic_write(SUTOM_DIR / "solution.json", json_dumps_pretty(data))
     return data
 
 
 def generate_archive_json(today: date, data: dict) -> None:
-    SUTOM_ARCHIVE.mkdir(parents=True, exist_ok=True)
+    _ensure_dirs()
     atomic_write(SUTOM_ARCHIVE / f"{today.isoformat()}.json",
-                 json.dumps(data, ensure_ascii=False, indent=2))
+                 json_dumps_pretty(data))
+    if _archives_cache is not None:
+        _cache_upsert(_archives_cache, data)
 
 
-def load_all_archives() -> list[dict]:
-    return _load_archives(SUTOM_ARCHIVE)
+# Archives déjà chargées dans ce processus (triées par date décroissante) :
+# les appels suivants réutilisent la liste, tenue à jour par generate_archive_json.
+_archives_cache: list[dict] | None = None
 
 
-def generate_archive_html(
-    d: date,
-    puzzle_num: int,
-    word: str,
-    prev_date,
-    next_date,
-) -> None:
-    """Génère docs/sutom/archive/YYYY-MM-DD.html."""
-    SUTOM_ARCHIVE.mkdir(parents=True, exist_ok=True)
-    date_str = d.isoformat()
-    date_display = date_fr(d)
-    letter_count = len(word)
-    first_letter = word[0] if word else "?"
+def _prepare_entry(e: dict) -> dict:
+    # Date parsée et formatée une seule fois, réutilisée par toutes les pages
+    e["_date"] = d = date.fromisoformat(e["date"])
+    e["_date_fr"] = date_fr(d)
+    # Mot normalisé en majuscules au chargement (déjà le cas depuis get_sutom_solution,
+    # par sécurité pour les anciennes archives) : les listes l'affichent tel quel
+    e["word"] = e["word"].upper()
+    return e
 
-    if prev_date is not None:
-        nav_prev = f'<a class="nav-link" href="{prev_date.isoformat()}">&#8592; {date_fr(prev_date)}</a>'
-    else:
-        nav_prev = '<span class="nav-disabled">&#8592; Plus ancien</span>'
 
-    if next_date is not None:
-        nav_next = f'<a class="nav-link" href="{next_date.isoformat()}">{date_fr(next_date)} &#8594;</a>'
-    else:
-        nav_next = '<a class="nav-link" href="../">Solution du jour &#8594;</a>'
+def _cache_upsert(entries: list[dict], data: dict) -> None:
+    """Remplace ou insère l'entrée du même jour en gardant l'ordre décroissant."""
+    entry = _prepare_entry(dict(data))
+    for i, e in enumerate(entries):
+        if e["date"] == entry["date"]:
+            entries[i] = entry
+            return
+        if e["date"] < entry["date"]:
+            entries.insert(i, entry)
+            return
+    entries.append(entry)
+
+
+def load_all_archives() -> list[dict]:
+    global _archives_cache
+    if _archives_cache is None:
+        _archives_cache = [_prepare_entry(e) for e in _load_archives(SUTOM_ARCHIVE)]
+    return _archives_cache
 
-    html = f"""<!DOCTYPE html>
+
+# ── Gabarits HTML ─────────────────────────────────────────────────────────────
+# Texte constant construit une seule fois ; seuls les champs {…} sont substitués
+# (str.format_map) à chaque page. Les accolades littérales (JSON-LD, JS) sont doublées.
+# Chaque page = en-tête + corps + script commun, écrits fragment par fragment.
+
+_ARCHIVE_HEAD_TPL = """<!DOCTYPE html>
 <html lang="fr">
 <head>
   <meta charset="UTF-8">
@@ -167,14 +235,16 @@ def generate_archive_html(
     ]
   }}
   </script>
-  {f'<link rel="prev" href="{prev_date.isoformat()}">' if prev_date else ''}
-  {f'<link rel="next" href="{next_date.isoformat()}">' if next_date else ''}
+  {link_prev}
+  {link_next}
 
   <link rel="stylesheet" href="../../css/style.css">
   <script data-goatcounter="https://j0hanj0han.goatcounter.com/count"
           async src="https://gc.zgo.at/count.js"></script>
 </head>
-<body>
+"""
+
+_ARCHIVE_BODY_TPL = """<body>
 
 <header class="site-header">
   <h1>Sutom — Archive</h1>
@@ -213,7 +283,7 @@ def generate_archive_html(
       <div style="text-align:center;margin:.5rem 0 1rem;">
         <div class="sutom-grid">
           <span class="sutom-cell sutom-correct">{first_letter}</span>
-          {"".join(f'<span class="sutom-cell sutom-empty">_</span>' for _ in range(letter_count - 1))}
+          {empty_cells}
         </div>
         <p class="puzzle-meta">{letter_count} lettres · commence par {first_letter}</p>
       </div>
@@ -250,150 +320,9 @@ def generate_archive_html(
   <p style="margin-top:.4rem;">Site non officiel — Solution générée automatiquement</p>
 </footer>
 
-<script>
-  function revealSolution() {{
-    document.getElementById('solution-wrap').classList.add('revealed');
-    document.getElementById('reveal-btn').style.display = 'none';
-  }}
-</script>
-
-</body>
-</html>"""
-
-    atomic_write(SUTOM_ARCHIVE / f"{date_str}.html", html)
-
-
-def generate_archive_index(entries: list[dict]) -> None:
-    """Génère docs/sutom/archive/index.html."""
-    SUTOM_ARCHIVE.mkdir(parents=True, exist_ok=True)
-
-    def item_html(e: dict) -> str:
-        d = date.fromisoformat(e["date"])
-        return (
-            f'      <li class="arch-item">'
-            f'<span class="arch-date">{date_fr(d)}</span>'
-            f'<span class="arch-num">#{e["puzzle_num"]}</span>'
-            f'<a class="arch-link" href="{e["date"]}">{e["word"].upper()}</a>'
-            f'</li>'
-        )
-
-    items_html = "\n".join(item_html(e) for e in entries)
-    count = len(entries)
-
-    html = f"""<!DOCTYPE html>
-<html lang="fr">
-<head>
-  <meta charset="UTF-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <link rel="icon" href="/favicon.svg" type="image/svg+xml">
-
-  <title>Archives Sutom — Toutes les solutions du jour</title>
-  <meta name="description" content="Retrouvez toutes les solutions passées de Sutom : réponses de chaque puzzle depuis le début.">
-  <meta name="robots" content="index, follow">
-  <link rel="canonical" href="{SUTOM_SITE_URL}/archive/">
-  <meta name="google-site-verification" content="KLhfwprI4hatb7c2RyrwsiYjulATuj0vJueDdJt0yLs">
-
-  <meta property="og:title" content="Archives Sutom — Toutes les solutions">
-  <meta property="og:description" content="Toutes les solutions passées du jeu Sutom.">
-  <meta property="og:type" content="website">
-  <meta property="og:url" content="{SUTOM_SITE_URL}/archive/">
-  <meta property="og:locale" content="fr_FR">
-  <meta property="og:site_name" content="Solutions du Jour">
-
-  <script type="application/ld+json">
-  {{
-    "@context": "https://schema.org",
-    "@type": "BreadcrumbList",
-    "itemListElement": [
-      {{"@type": "ListItem", "position": 1, "name": "Accueil", "item": "{SITE_URL}/"}},
-      {{"@type": "ListItem", "position": 2, "name": "Sutom", "item": "{SUTOM_SITE_URL}/"}},
-      {{"@type": "ListItem", "position": 3, "name": "Archives"}}
-    ]
-  }}
-  </script>
-
-  <link rel="stylesheet" href="../../css/style.css">
-  <script data-goatcounter="https://j0hanj0han.goatcounter.com/count"
-          async src="https://gc.zgo.at/count.js"></script>
-</head>
-<body>
-
-<header class="site-header">
-  <h1>Archives Sutom</h1>
-  <p class="subtitle">{count} solution{"s" if count > 1 else ""} enregistrée{"s" if count > 1 else ""}</p>
-</header>
-
-<main>
-<nav class="breadcrumb" aria-label="Fil d'Ariane">
-  <a href="{SITE_URL}/">Accueil</a> &rsaquo;
-  <a href="../">Sutom</a> &rsaquo;
-  <span>Archives</span>
-</nav>
-  <div class="card">
-    <h2>Toutes les solutions Sutom ({count})</h2>
-    <p style="font-size:.9rem;color:#6b7280;margin-bottom:1rem;">
-      Cliquez sur un mot pour voir la solution complète de ce jour.
-    </p>
-    <ul class="arch-list">
-{items_html}
-    </ul>
-  </div>
-
-  <div style="text-align:center;margin-top:.5rem;">
-    <a class="reveal-btn" href="../">Solution du jour &#8594;</a>
-  </div>
-</main>
-
-<footer>
-  <p>
-    <a href="../">Solution du jour</a> ·
-    <a href="https://sutom.nocle.fr" rel="noopener" target="_blank">Jouer à Sutom</a>
-  </p>
-  <p style="margin-top:.4rem;">Site non officiel — Solution générée automatiquement</p>
-</footer>
-
-</body>
-</html>"""
-
-    atomic_write(SUTOM_ARCHIVE / "index.html", html)
-
-
-def generate_index_html(
-    today: date,
-    puzzle_num: int,
-    word: str,
-    recent_archives: list | None = None,
-) -> None:
-    """Génère docs/sutom/index.html."""
-    date_str = today.isoformat()
-    date_display = date_fr(today)
-    letter_count = len(word)
-    first_letter = word[0] if word else "?"
-
-    recent_archives_card = ""
-    if recent_archives:
-        def arch_item(e: dict) -> str:
-            d = date.fromisoformat(e["date"])
-            return (
-                f'      <li class="arch-item">'
-                f'<span class="arch-date">{date_fr(d)}</span>'
-                f'<span class="arch-num">#{e["puzzle_num"]}</span>'
-                f'<a class="arch-link" href="archive/{e["date"]}">{e["word"].upper()}</a>'
-                f'</li>'
-            )
-        items = "\n".join(arch_item(e) for e in recent_archives[:7])
-        recent_archives_card = f"""
-    <div class="card">
-      <h2>Solutions précédentes</h2>
-      <ul class="arch-list">
-{items}
-      </ul>
-      <p style="margin-top:.75rem;font-size:.9rem;">
-        <a href="archive/">Voir toutes les archives &#8594;</a>
-      </p>
-    </div>"""
+"""
 
-    html = f"""<!DOCTYPE html>
+_INDEX_HEAD_TPL = """<!DOCTYPE html>
 <html lang="fr">
 <head>
   <meta charset="UTF-8">
@@ -478,7 +407,9 @@ def generate_index_html(
   <script data-goatcounter="https://j0hanj0han.goatcounter.com/count"
           async src="https://gc.zgo.at/count.js"></script>
 </head>
-<body>
+"""
+
+_INDEX_BODY_TPL = """<body>
 
 <header class="site-header">
   <h1>Sutom — Solution du jour</h1>
@@ -510,7 +441,7 @@ def generate_index_html(
       <div style="text-align:center;margin:.5rem 0 1rem;">
         <div class="sutom-grid">
           <span class="sutom-cell sutom-correct">{first_letter}</span>
-          {"".join(f'<span class="sutom-cell sutom-empty">_</span>' for _ in range(letter_count - 1))}
+          {empty_cells}
         </div>
         <p class="puzzle-meta">{letter_count} lettres · commence par {first_letter}</p>
       </div>
@@ -582,26 +513,97 @@ def generate_index_html(
   <p style="margin-top:.4rem;">Jouer sur <a href="https://sutom.nocle.fr" rel="noopener" target="_blank">sutom.nocle.fr</a></p>
 </footer>
 
-<script>
-  function revealSolution() {{
+"""
+
+# Script commun aux deux pages (texte brut, non formaté)
+_PAGE_SCRIPT = """<script>
+  function revealSolution() {
     document.getElementById('solution-wrap').classList.add('revealed');
     document.getElementById('reveal-btn').style.display = 'none';
-  }}
+  }
 </script>
 
 </body>
 </html>"""
 
-    atomic_write(SUTOM_DIR / "index.html", html)
+# Liste complète des archives (docs/sutom/archive/index.html)
+_ARCHIVE_INDEX_TPL = """<!DOCTYPE html>
+<html lang="fr">
+<head>
+  <meta charset="UTF-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1.0">
+  <link rel="icon" href="/favicon.svg" type="image/svg+xml">
 
+  <title>Archives Sutom — Toutes les solutions du jour</title>
+  <meta name="description" content="Retrouvez toutes les solutions passées de Sutom : réponses de chaque puzzle depuis le début.">
+  <meta name="robots" content="index, follow">
+  <link rel="canonical" href="{SUTOM_SITE_URL}/archive/">
+  <meta name="google-site-verification" content="KLhfwprI4hatb7c2RyrwsiYjulATuj0vJueDdJt0yLs">
 
-def generate_unavailable_html(today: date) -> None:
-    """Génère une page 'solution non disponible' pour Sutom."""
-    SUTOM_DIR.mkdir(parents=True, exist_ok=True)
-    date_display = date_fr(today)
-    date_str = today.isoformat()
+  <meta property="og:title" content="Archives Sutom — Toutes les solutions">
+  <meta property="og:description" content="Toutes les solutions passées du jeu Sutom.">
+  <meta property="og:type" content="website">
+  <meta property="og:url" content="{SUTOM_SITE_URL}/archive/">
+  <meta property="og:locale" content="fr_FR">
+  <meta property="og:site_name" content="Solutions du Jour">
+
+  <script type="application/ld+json">
+  {{
+    "@context": "https://schema.org",
+    "@type": "BreadcrumbList",
+    "itemListElement": [
+      {{"@type": "ListItem", "position": 1, "name": "Accueil", "item": "{SITE_URL}/"}},
+      {{"@type": "ListItem", "position": 2, "name": "Sutom", "item": "{SUTOM_SITE_URL}/"}},
+      {{"@type": "ListItem", "position": 3, "name": "Archives"}}
+    ]
+  }}
+  </script>
+
+  <link rel="stylesheet" href="../../css/style.css">
+  <script data-goatcounter="https://j0hanj0han.goatcounter.com/count"
+          async src="https://gc.zgo.at/count.js"></script>
+</head>
+<body>
+
+<header class="site-header">
+  <h1>Archives Sutom</h1>
+  <p class="subtitle">{count} solution{plural} enregistrée{plural}</p>
+</header>
 
-    html = f"""<!DOCTYPE html>
+<main>
+<nav class="breadcrumb" aria-label="Fil d'Ariane">
+  <a href="{SITE_URL}/">Accueil</a> &rsaquo;
+  <a href="../">Sutom</a> &rsaquo;
+  <span>Archives</span>
+</nav>
+  <div class="card">
+    <h2>Toutes les solutions Sutom ({count})</h2>
+    <p style="font-size:.9rem;color:#6b7280;margin-bottom:1rem;">
+      Cliquez sur un mot pour voir la solution complète de ce jour.
+    </p>
+    <ul class="arch-list">
+{items_html}
+    </ul>
+  </div>
+
+  <div style="text-align:center;margin-top:.5rem;">
+    <a class="reveal-btn" href="../">Solution du jour &#8594;</a>
+  </div>
+</main>
+
+<footer>
+  <p>
+    <a href="../">Solution du jour</a> ·
+    <a href="https://sutom.nocle.fr" rel="noopener" target="_blank">Jouer à Sutom</a>
+  </p>
+  <p style="margin-top:.4rem;">Site non officiel — Solution générée automatiquement</p>
+</footer>
+
+</body>
+</html>"""
+
+# Page de repli quand la solution du jour n'a pas pu être récupérée
+_UNAVAILABLE_TPL = """<!DOCTYPE html>
 <html lang="fr">
 <head>
   <meta charset="UTF-8">
@@ -636,7 +638,142 @@ def generate_unavailable_html(today: date) -> None:
 </body>
 </html>"""
 
-    atomic_write(SUTOM_DIR / "index.html", html)
+# Case vide de la grille (répétée letter_count - 1 fois)
+_EMPTY_CELL = '<span class="sutom-cell sutom-empty">_</span>'
+
+# Ligne de liste d'archives : date affichée, numéro, lien, mot
+_ITEM_TPL = (
+    '      <li class="arch-item">'
+    '<span class="arch-date">{0}</span>'
+    '<span class="arch-num">#{1}</span>'
+    '<a class="arch-link" href="{2}">{3}</a>'
+    '</li>'
+)
+
+
+def _render_page(ctx: dict, head_tpl: str, body_tpl: str) -> Iterator[str]:
+    """Produit la page fragment par fragment (voir atomic_write_iter)."""
+    yield head_tpl.format_map(ctx)
+    yield body_tpl.format_map(ctx)
+    yield _PAGE_SCRIPT
+
+
+def generate_archive_html(
+    d: date,
+    puzzle_num: int,
+    word: str,
+    prev_date,
+    next_date,
+    fsync: bool = True,
+) -> None:
+    """Génère docs/sutom/archive/YYYY-MM-DD.html."""
+    _ensure_dirs()
+    date_str = d.isoformat()
+    date_display = date_fr(d)
+    letter_count = len(word)
+    first_letter = word[0] if word else "?"
+
+    if prev_date is not None:
+        nav_prev = f'<a class="nav-link" href="{prev_date.isoformat()}">&#8592; {date_fr(prev_date)}</a>'
+    else:
+        nav_prev = '<span class="nav-disabled">&#8592; Plus ancien</span>'
+
+    if next_date is not None:
+        nav_next = f'<a class="nav-link" href="{next_date.isoformat()}">{date_fr(next_date)} &#8594;</a>'
+    else:
+        nav_next = '<a class="nav-link" href="../">Solution du jour &#8594;</a>'
+
+    ctx = {
+        "SUTOM_SITE_URL": SUTOM_SITE_URL,
+        "date_str": date_str,
+        "date_display": date_display,
+        "puzzle_num": puzzle_num,
+        "word": word,
+        "letter_count": letter_count,
+        "first_letter": first_letter,
+        "empty_cells": _EMPTY_CELL * (letter_count - 1),
+        "link_prev": f'<link rel="prev" href="{prev_date.isoformat()}">' if prev_date else "",
+        "link_next": f'<link rel="next" href="{next_date.isoformat()}">' if next_date else "",
+        "nav_prev": nav_prev,
+        "nav_next": nav_next,
+    }
+    atomic_write_iter(SUTOM_ARCHIVE / f"{date_str}.html",
+                      _render_page(ctx, _ARCHIVE_HEAD_TPL, _ARCHIVE_BODY_TPL), fsync)
+
+
+def generate_archive_index(entries: list[dict]) -> None:
+    """Génère docs/sutom/archive/index.html."""
+    _ensure_dirs()
+
+    # Liste en compréhension (et non générateur) : join connaît la taille d'avance
+    items_html = "\n".join([
+        _ITEM_TPL.format(e["_date_fr"], e["puzzle_num"], e["date"], e["word"])
+        for e in entries
+    ])
+    count = len(entries)
+
+    ctx = {
+        "SITE_URL": SITE_URL,
+        "SUTOM_SITE_URL": SUTOM_SITE_URL,
+        "count": count,
+        "plural": "s" if count > 1 else "",
+        "items_html": items_html,
+    }
+    atomic_write(SUTOM_ARCHIVE / "index.html", _ARCHIVE_INDEX_TPL.format_map(ctx))
+
+
+def generate_index_html(
+    today: date,
+    puzzle_num: int,
+    word: str,
+    recent_archives: list | None = None,
+) -> None:
+    """Génère docs/sutom/index.html."""
+    date_str = today.isoformat()
+    date_display = date_fr(today)
+    letter_count = len(word)
+    first_letter = word[0] if word else "?"
+
+    recent_archives_card = ""
+    if recent_archives:
+        items = "\n".join([
+            _ITEM_TPL.format(e["_date_fr"], e["puzzle_num"], "archive/" + e["date"], e["word"])
+            for e in recent_archives[:7]
+        ])
+        recent_archives_card = f"""
+    <div class="card">
+      <h2>Solutions précédentes</h2>
+      <ul class="arch-list">
+{items}
+      </ul>
+      <p style="margin-top:.75rem;font-size:.9rem;">
+        <a href="archive/">Voir toutes les archives &#8594;</a>
+      </p>
+    </div>"""
+
+    ctx = {
+        "SITE_URL": SITE_URL,
+        "SUTOM_SITE_URL": SUTOM_SITE_URL,
+        "date_str": date_str,
+        "date_display": date_display,
+        "puzzle_num": puzzle_num,
+        "word": word,
+        "letter_count": letter_count,
+        "first_letter": first_letter,
+        "empty_cells": _EMPTY_CELL * (letter_count - 1),
+        "recent_archives_card": recent_archives_card,
+    }
+    atomic_write_iter(SUTOM_DIR / "index.html", _render_page(ctx, _INDEX_HEAD_TPL, _INDEX_BODY_TPL))
+
+
+def generate_unavailable_html(today: date) -> None:
+    """Génère une page 'solution non disponible' pour Sutom."""
+    _ensure_dirs()
+    ctx = {
+        "SITE_URL": SITE_URL,
+        "date_display": date_fr(today),
+    }
+    atomic_write(SUTOM_DIR / "index.html", _UNAVAILABLE_TPL.format_map(ctx))
 
 
 # ── Orchestration HTML ────────────────────────────────────────────────────────
@@ -645,14 +782,42 @@ def _generate_all_html(today: date, puzzle_num: int, word: str) -> None:
     """Génère tous les fichiers HTML Sutom à partir des JSON déjà en place."""
     all_archives = load_all_archives()
     today_str = today.isoformat()
-    past_archives = [e for e in all_archives if e["date"] != today_str]
+    # Archives triées par date décroissante (cf. core.iter_all_archives) : l'entrée
+    # du jour, si présente, est la première dont la date n'est pas dans le futur.
+    n = len(all_archives)
+    i = next((i for i, e in enumerate(all_archives) if e["date"] <= today_str), n)
+    if i < n and all_archives[i]["date"] == today_str:
+        past_archives = all_archives[:i] + all_archives[i + 1:]
+    else:
+        past_archives = all_archives
 
     print(f"[Sutom] Génération des pages HTML d'archive ({len(past_archives)} pages)…")
+    # Une page n'est réécrite que si ses entrées (ou le code) ont changé depuis le
+    # dernier passage : en pratique, la nouvelle archive et sa voisine.
+    manifest_path = SUTOM_ARCHIVE / PAGE_MANIFEST_NAME
+    manifest = load_manifest(manifest_path)
+    new_manifest = {}
+    code = code_key(__file__)
+    todo = []
     for i, entry in enumerate(past_archives):
-        d = date.fromisoformat(entry["date"])
-        prev_date = date.fromisoformat(past_archives[i + 1]["date"]) if i + 1 < len(past_archives) else None
-        next_date = date.fromisoformat(past_archives[i - 1]["date"]) if i > 0 else None
-        generate_archive_html(d, entry["puzzle_num"], entry["word"], prev_date, next_date)
+        d = entry["_date"]
+        prev_date = past_archives[i + 1]["_date"] if i + 1 < len(past_archives) else None
+        next_date = past_archives[i - 1]["_date"] if i > 0 else None
+        key = page_key(code, entry["puzzle_num"], entry["word"], prev_date, next_date)
+        new_manifest[entry["date"]] = key
+        if manifest.get(entry["date"]) == key and (SUTOM_ARCHIVE / f"{entry['date']}.html").exists():
+            continue
+        todo.append((d, entry["puzzle_num"], entry["word"], prev_date, next_date))
+    if todo:
+        # Pages indépendantes : écritures réparties sur un pool de threads (I/O bound)
+        with ThreadPoolExecutor(max_workers=min(32, len(todo))) as pool:
+            futures = [pool.submit(generate_archive_html, *args, fsync=False) for args in todo]
+            for fut in as_completed(futures):
+                fut.result()  # propage la première erreur, comme la boucle séquentielle
+        sync_dir(SUTOM_ARCHIVE)  # un seul fsync pour tout le lot
+    if new_manifest != manifest:
+        save_manifest(manifest_path, new_manifest)
+    print(f"[Sutom]    {len(todo)} page(s) réécrite(s)")
 
     print("[Sutom] Génération de docs/sutom/archive/index.html…")
     generate_archive_index(past_archives)
@@ -662,6 +827,40 @@ def _generate_all_html(today: date, puzzle_num: int, word: str) -> None:
     generate_index_html(today, puzzle_num, word, recent_archives)
 
 
+# Dernière génération complète (non versionnée) : permet aux relances du même
+# jour de ne rien refaire si ni la solution, ni les archives, ni le code n'ont
+# changé. Toute écriture dans archive/ (ajout, remplacement, suppression) modifie
+# le mtime du dossier ; index.html est réécrit par la page « indisponible ».
+_LAST_BUILT_PATH = SUTOM_DIR / ".last_built"
+
+
+def _build_key(data: dict) -> str | None:
+    try:
+        archive_mtime = SUTOM_ARCHIVE.stat().st_mtime_ns
+        index_mtime = (SUTOM_DIR / "index.html").stat().st_mtime_ns
+        if not (SUTOM_ARCHIVE / "index.html").exists():
+            return None
+    except OSError:
+        return None
+    return page_key(code_key(__file__), data, archive_mtime, index_mtime)
+
+
+def _read_last_built() -> str | None:
+    try:
+        return _LAST_BUILT_PATH.read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def _write_last_built(key: str | None) -> None:
+    if key is None:
+        return
+    try:
+        _LAST_BUILT_PATH.write_text(key, encoding="utf-8")
+    except OSError:
+        pass  # cache facultatif
+
+
 # ── Point d'entrée ────────────────────────────────────────────────────────────
 
 def run(today: date) -> dict | None:
@@ -669,19 +868,22 @@ def run(today: date) -> dict | None:
     Récupère la solution Sutom du jour et génère tous les fichiers.
     Retourne le dict data ou None si la solution est indisponible.
     """
-    SUTOM_DIR.mkdir(parents=True, exist_ok=True)
-    SUTOM_ARCHIVE.mkdir(parents=True, exist_ok=True)
+    _ensure_dirs()
 
     # Vérifier si la solution est déjà générée pour aujourd'hui
     solution_path = SUTOM_DIR / "solution.json"
     if solution_path.exists():
-        existing = json.loads(solution_path.read_text(encoding="utf-8"))
+        existing = json_loads(solution_path.read_bytes())
         if existing.get("date") == today.isoformat() and existing.get("word"):
             word = existing["word"]
             puzzle_num = existing["puzzle_num"]
             print(f"[Sutom] ℹ Solution déjà présente : {word!r} — régénération HTML uniquement.")
             generate_archive_json(today, existing)
+            if _build_key(existing) == _read_last_built():
+                print("[Sutom] ℹ Pages déjà à jour — rien à régénérer.")
+                return existing
             _generate_all_html(today, puzzle_num, word)
+            _write_last_built(_build_key(existing))
             return existing
 
     # Récupérer la solution
@@ -695,12 +897,14 @@ def run(today: date) -> dict | None:
 
     print(f"[Sutom] ✅ Solution : {word!r} (puzzle #{puzzle_num}, {len(word)} lettres)")
 
-    # Fichiers JSON
-    data = generate_solution_json(today, puzzle_num, word)
+    # Fichiers JSON : un seul horodatage pour solution.json et l'archive du jour
+    generated_at = datetime.now(timezone.utc).isoformat()
+    data = generate_solution_json(today, puzzle_num, word, generated_at)
     generate_archive_json(today, data)
 
     # HTML
     _generate_all_html(today, puzzle_num, word)
+    _write_last_built(_build_key(data))
 
     print(f"[Sutom] 🎉 Site généré ({today.isoformat()}, #{puzzle_num}, {word!r})")
     return data
@@ -13,36 +13,37 @@ Produit :
 """
 
 import argparse
-import json
+import os
+import sys
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
 from datetime import date, timedelta
+from functools import partial
+from html import escape
+from itertools import chain
 from pathlib import Path
 
-from core import SITE_URL, DOCS_DIR, date_fr, atomic_write
+from core import (
+    SITE_URL, DOCS_DIR, PAGE_MANIFEST_NAME, date_fr, atomic_write, atomic_write_iter,
+    archive_dates, fsync_barrier, json_loads, code_key, page_key, load_manifest, save_manifest,
+)
+
+# Échappement XML (&, <, >) : mêmes sorties que xml.sax.saxutils.escape, sans
+# charger xml.sax (qui importe urllib.request) pour deux sitemaps
+xml_escape = partial(escape, quote=False)
 
 MODEL_PATH_DEFAULT = "frWac_non_lem_no_postag_no_phrase_200_cbow_cut100.bin"
 
 
-# ── Hub page ──────────────────────────────────────────────────────────────────
+# ── Gabarits du hub ───────────────────────────────────────────────────────────
+# Texte constant construit une seule fois ; seuls les champs {…} sont substitués
+# (str.format / format_map). Les accolades littérales (JSON-LD, JS) sont doublées.
+# Chaque jeu a deux cartes : solution disponible (_TPL) ou non (_OFF, texte fixe).
 
-def generate_hub_html(today: date, game_data: dict) -> None:
-    """
-    Génère docs/index.html — page d'accueil listant tous les jeux.
-    game_data : {"cemantix": dict|None, "sutom": dict|None, "loto": dict|None}
-    """
-    date_display = date_fr(today)
-    date_str = today.isoformat()
-
-    cemantix = game_data.get("cemantix")
-    sutom = game_data.get("sutom")
-    loto = game_data.get("loto")
-    em = game_data.get("euromillions")
-    pedantix = game_data.get("pedantix")
-
-    # ── Carte Cémantix ──
-    if cemantix:
-        word_c = cemantix["word"]
-        puzzle_c = cemantix["puzzle_num"]
-        cemantix_card = f"""
+# Cémantix
+_CEMANTIX_CARD_TPL = """
     <a class="game-card" href="cemantix/">
       <div class="game-card-header">
         <h2 class="game-card-title">Cémantix</h2>
@@ -50,16 +51,16 @@ def generate_hub_html(today: date, game_data: dict) -> None:
       </div>
       <p class="game-card-desc">Devinez le mot secret grâce à la proximité sémantique.</p>
       <div class="game-card-solution">
-        <span class="game-label">Solution #{puzzle_c}</span>
+        <span class="game-label">Solution #{puzzle_num}</span>
         <div class="solution-blur solution-blur-sm" id="sol-cemantix">
-          <span class="solution-word solution-word-sm">{word_c}</span>
+          <span class="solution-word solution-word-sm">{word}</span>
         </div>
-        <button class="reveal-btn-sm" onclick="reveal(event,'sol-cemantix')">Révéler</button>
+        <button class="reveal-btn-sm" data-target="sol-cemantix">Révéler</button>
       </div>
       <span class="game-link-arrow">Voir la solution &amp; indices &#8594;</span>
     </a>"""
-    else:
-        cemantix_card = """
+
+_CEMANTIX_CARD_OFF = """
     <a class="game-card game-card-unavailable" href="cemantix/">
       <div class="game-card-header">
         <h2 class="game-card-title">Cémantix</h2>
@@ -70,13 +71,8 @@ def generate_hub_html(today: date, game_data: dict) -> None:
       <span class="game-link-arrow">Aller sur Cémantix &#8594;</span>
     </a>"""
 
-    # ── Carte Sutom ──
-    if sutom:
-        word_s = sutom["word"]
-        puzzle_s = sutom["puzzle_num"]
-        letter_count = sutom.get("letter_count", len(word_s))
-        first_letter = sutom.get("first_letter", word_s[0])
-        sutom_card = f"""
+# Sutom
+_SUTOM_CARD_TPL = """
     <a class="game-card" href="sutom/">
       <div class="game-card-header">
         <h2 class="game-card-title">Sutom</h2>
@@ -84,16 +80,16 @@ def generate_hub_html(today: date, game_data: dict) -> None:
       </div>
       <p class="game-card-desc">Devinez le mot en {letter_count} lettres (commence par {first_letter}).</p>
       <div class="game-card-solution">
-        <span class="game-label">Solution #{puzzle_s}</span>
+        <span class="game-label">Solution #{puzzle_num}</span>
         <div class="solution-blur solution-blur-sm" id="sol-sutom">
-          <span class="solution-word solution-word-sm">{word_s}</span>
+          <span class="solution-word solution-word-sm">{word}</span>
         </div>
-        <button class="reveal-btn-sm" onclick="reveal(event,'sol-sutom')">Révéler</button>
+        <button class="reveal-btn-sm" data-target="sol-sutom">Révéler</button>
       </div>
       <span class="game-link-arrow">Voir la solution &#8594;</span>
     </a>"""
-    else:
-        sutom_card = """
+
+_SUTOM_CARD_OFF = """
     <a class="game-card game-card-unavailable" href="sutom/">
       <div class="game-card-header">
         <h2 class="game-card-title">Sutom</h2>
@@ -104,31 +100,25 @@ def generate_hub_html(today: date, game_data: dict) -> None:
       <span class="game-link-arrow">Aller sur Sutom &#8594;</span>
     </a>"""
 
-    # ── Carte Loto ──
-    if loto:
-        from games.loto import _balls_html as _loto_balls
-        draw_date_display = date_fr(date.fromisoformat(loto["date"]))
-        balls = loto["balls"]
-        lucky = loto["lucky_ball"]
-        balls_str = " · ".join(str(b) for b in balls)
-        loto_card = f"""
+# Loto
+_LOTO_CARD_TPL = """
     <a class="game-card" href="loto/">
       <div class="game-card-header">
         <h2 class="game-card-title">Loto</h2>
         <span class="game-badge game-badge-loto">FDJ</span>
       </div>
-      <p class="game-card-desc">Résultats du tirage n°{loto["draw_num"]} du {draw_date_display}.</p>
+      <p class="game-card-desc">Résultats du tirage n°{draw_num} du {date_display}.</p>
       <div class="game-card-solution" style="flex-direction:column;align-items:flex-start;gap:.4rem;">
         <span class="game-label">Numéros gagnants</span>
         <div class="solution-blur solution-blur-sm" id="sol-loto">
-          {_loto_balls(balls, lucky, small=True)}
+          {balls_html}
         </div>
-        <button class="reveal-btn-sm" onclick="reveal(event,'sol-loto')">Révéler</button>
+        <button class="reveal-btn-sm" data-target="sol-loto">Révéler</button>
       </div>
       <span class="game-link-arrow">Voir tous les résultats &#8594;</span>
     </a>"""
-    else:
-        loto_card = """
+
+_LOTO_CARD_OFF = """
     <a class="game-card game-card-unavailable" href="loto/">
       <div class="game-card-header">
         <h2 class="game-card-title">Loto</h2>
@@ -139,31 +129,25 @@ def generate_hub_html(today: date, game_data: dict) -> None:
       <span class="game-link-arrow">Aller sur Loto &#8594;</span>
     </a>"""
 
-    # ── Carte EuroMillions ──
-    if em:
-        from games.euromillions import _em_balls_html
-        draw_date_em = date.fromisoformat(em["date"])
-        em_date_display = date_fr(draw_date_em)
-        em_balls_str = " · ".join(str(b) for b in em["balls"])
-        em_stars_str = " · ".join(str(s) for s in em["stars"])
-        em_card = f"""
+# EuroMillions
+_EM_CARD_TPL = """
     <a class="game-card" href="euromillions/">
       <div class="game-card-header">
         <h2 class="game-card-title">EuroMillions</h2>
         <span class="game-badge game-badge-em">&#9733; Multi-pays</span>
       </div>
-      <p class="game-card-desc">Tirage du {em_date_display} — 5 boules + 2 étoiles.</p>
+      <p class="game-card-desc">Tirage du {date_display} — 5 boules + 2 étoiles.</p>
       <div class="game-card-solution" style="flex-direction:column;align-items:flex-start;gap:.4rem;">
         <span class="game-label">Numéros gagnants</span>
         <div class="solution-blur solution-blur-sm" id="sol-em">
-          {_em_balls_html(em["balls"], em["stars"], small=True)}
+          {balls_html}
         </div>
-        <button class="reveal-btn-sm" onclick="reveal(event,'sol-em')">Révéler</button>
+        <button class="reveal-btn-sm" data-target="sol-em">Révéler</button>
       </div>
       <span class="game-link-arrow">Voir tous les résultats &#8594;</span>
     </a>"""
-    else:
-        em_card = """
+
+_EM_CARD_OFF = """
     <a class="game-card game-card-unavailable" href="euromillions/">
       <div class="game-card-header">
         <h2 class="game-card-title">EuroMillions</h2>
@@ -174,11 +158,8 @@ def generate_hub_html(today: date, game_data: dict) -> None:
       <span class="game-link-arrow">Aller sur EuroMillions &#8594;</span>
     </a>"""
 
-    # ── Carte Pédantix ──
-    if pedantix:
-        title_p = pedantix.get("title_display") or pedantix.get("word", "?")
-        puzzle_p = pedantix["puzzle_num"]
-        pedantix_card = f"""
+# Pédantix
+_PEDANTIX_CARD_TPL = """
     <a class="game-card" href="pedantix/">
       <div class="game-card-header">
         <h2 class="game-card-title">Pédantix</h2>
@@ -186,16 +167,16 @@ def generate_hub_html(today: date, game_data: dict) -> None:
       </div>
       <p class="game-card-desc">Devinez l'article Wikipedia secret par similarité sémantique.</p>
       <div class="game-card-solution">
-        <span class="game-label">Solution #{puzzle_p}</span>
+        <span class="game-label">Solution #{puzzle_num}</span>
         <div class="solution-blur solution-blur-sm" id="sol-pedantix">
-          <span class="solution-word solution-word-sm">{title_p}</span>
+          <span class="solution-word solution-word-sm">{title}</span>
         </div>
-        <button class="reveal-btn-sm" onclick="reveal(event,'sol-pedantix')">Révéler</button>
+        <button class="reveal-btn-sm" data-target="sol-pedantix">Révéler</button>
       </div>
       <span class="game-link-arrow">Voir la solution &amp; indices &#8594;</span>
     </a>"""
-    else:
-        pedantix_card = """
+
+_PEDANTIX_CARD_OFF = """
     <a class="game-card game-card-unavailable" href="pedantix/">
       <div class="game-card-header">
         <h2 class="game-card-title">Pédantix</h2>
@@ -206,7 +187,7 @@ def generate_hub_html(today: date, game_data: dict) -> None:
       <span class="game-link-arrow">Aller sur Pédantix &#8594;</span>
     </a>"""
 
-    html = f"""<!DOCTYPE html>
+_HUB_TPL = """<!DOCTYPE html>
 <html lang="fr">
 <head>
   <meta charset="UTF-8">
@@ -367,25 +348,139 @@ def generate_hub_html(today: date, game_data: dict) -> None:
   </p>
 </footer>
 
-<script>
-  function reveal(e, id) {{
-    e.preventDefault();
-    e.stopPropagation();
-    var el = document.getElementById(id);
-    if (el) el.classList.add('revealed');
-    e.target.style.display = 'none';
-  }}
-</script>
+<script src="js/reveal.js" defer></script>
 
 </body>
 </html>"""
 
-    atomic_write(DOCS_DIR / "index.html", html)
+
+# ── Empreintes des fichiers racine ────────────────────────────────────────────
+# docs/.manifest.json : {fichier: empreinte des entrées} (voir core.page_key).
+# Un fichier dont les entrées n'ont pas changé n'est ni recalculé ni relu.
+
+_ROOT_MANIFEST = DOCS_DIR / PAGE_MANIFEST_NAME
+
+
+def _hub_code_key() -> str:
+    games_dir = Path(__file__).parent / "games"
+    # Les boules Loto / EuroMillions du hub sont rendues par ces modules
+    return code_key(__file__, games_dir / "loto.py", games_dir / "euromillions.py")
+
+
+def _up_to_date(name: str, key: str) -> bool:
+    return load_manifest(_ROOT_MANIFEST).get(name) == key and (DOCS_DIR / name).exists()
+
+
+def _mark_done(name: str, key: str) -> None:
+    manifest = load_manifest(_ROOT_MANIFEST)
+    if manifest.get(name) != key:
+        manifest[name] = key
+        save_manifest(_ROOT_MANIFEST, manifest)
+
+
+# ── Hub page ──────────────────────────────────────────────────────────────────
+
+def generate_hub_html(today: date, game_data: dict, fsync: bool = True) -> None:
+    """
+    Génère docs/index.html — page d'accueil listant tous les jeux.
+    game_data : {"cemantix": dict|None, "sutom": dict|None, "loto": dict|None}
+    """
+    # Mêmes données, même jour, même code → page identique : rien à refaire
+    key = page_key(_hub_code_key(), today, game_data)
+    if _up_to_date("index.html", key):
+        return
+
+    cemantix = game_data.get("cemantix")
+    sutom = game_data.get("sutom")
+    loto = game_data.get("loto")
+    em = game_data.get("euromillions")
+    pedantix = game_data.get("pedantix")
+
+    # ── Carte Cémantix ──
+    if cemantix:
+        cemantix_card = _CEMANTIX_CARD_TPL.format(
+            puzzle_num=cemantix["puzzle_num"], word=cemantix["word"],
+        )
+    else:
+        cemantix_card = _CEMANTIX_CARD_OFF
+
+    # ── Carte Sutom ──
+    if sutom:
+        word_s = sutom["word"]
+        sutom_card = _SUTOM_CARD_TPL.format(
+            puzzle_num=sutom["puzzle_num"], word=word_s,
+            letter_count=sutom.get("letter_count", len(word_s)),
+            first_letter=sutom.get("first_letter", word_s[0]),
+        )
+    else:
+        sutom_card = _SUTOM_CARD_OFF
+
+    # ── Carte Loto ──
+    if loto:
+        from games.loto import _balls_html as _loto_balls
+        loto_card = _LOTO_CARD_TPL.format(
+            draw_num=loto["draw_num"],
+            date_display=date_fr(date.fromisoformat(loto["date"])),
+            balls_html=_loto_balls(loto["balls"], loto["lucky_ball"], small=True),
+        )
+    else:
+        loto_card = _LOTO_CARD_OFF
+
+    # ── Carte EuroMillions ──
+    if em:
+        from games.euromillions import _em_balls_html
+        em_card = _EM_CARD_TPL.format(
+            date_display=date_fr(date.fromisoformat(em["date"])),
+            balls_html=_em_balls_html(em["balls"], em["stars"], small=True),
+        )
+    else:
+        em_card = _EM_CARD_OFF
+
+    # ── Carte Pédantix ──
+    if pedantix:
+        pedantix_card = _PEDANTIX_CARD_TPL.format(
+            puzzle_num=pedantix["puzzle_num"],
+            title=pedantix.get("title_display") or pedantix.get("word", "?"),
+        )
+    else:
+        pedantix_card = _PEDANTIX_CARD_OFF
+
+    atomic_write(DOCS_DIR / "index.html", _HUB_TPL.format_map({
+        "SITE_URL": SITE_URL,
+        "date_display": date_fr(today),
+        "date_str": today.isoformat(),
+        "cemantix_card": cemantix_card,
+        "sutom_card": sutom_card,
+        "pedantix_card": pedantix_card,
+        "loto_card": loto_card,
+        "em_card": em_card,
+    }), fsync)
+    _mark_done("index.html", key)
 
 
 # ── Google News Sitemap ───────────────────────────────────────────────────────
 
-def generate_news_sitemap(today: date, game_data: dict) -> None:
+_NEWS_SITEMAP_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"\n'
+    '        xmlns:news="http://www.google.com/schemas/sitemap-news/0.9">\n'
+)
+# Une entrée <url> : loc, date de publication, titre
+_NEWS_URL_TPL = """  <url>
+    <loc>{}</loc>
+    <news:news>
+      <news:publication>
+        <news:name>Solutions du Jour</news:name>
+        <news:language>fr</news:language>
+      </news:publication>
+      <news:publication_date>{}</news:publication_date>
+      <news:title>{}</news:title>
+    </news:news>
+  </url>
+"""
+
+
+def generate_news_sitemap(today: date, game_data: dict, fsync: bool = True) -> None:
     """Génère docs/news-sitemap.xml — Google News sitemap (fenêtre 48h).
 
     Inclut les pages du jour (et d'hier si disponible) pour chaque jeu.
@@ -437,261 +532,199 @@ def generate_news_sitemap(today: date, game_data: dict) -> None:
     if not entries:
         return
 
-    news_entries = []
-    for loc, pub_dt, title in entries:
-        news_entries.append(f"""  <url>
-    <loc>{loc}</loc>
-    <news:news>
-      <news:publication>
-        <news:name>Solutions du Jour</news:name>
-        <news:language>fr</news:language>
-      </news:publication>
-      <news:publication_date>{pub_dt}</news:publication_date>
-      <news:title>{title}</news:title>
-    </news:news>
-  </url>""")
+    # Entrées écrites au fil de l'eau, comme le sitemap global
+    atomic_write_iter(DOCS_DIR / "news-sitemap.xml", chain(
+        (_NEWS_SITEMAP_HEAD,),
+        (_NEWS_URL_TPL.format(*map(xml_escape, entry)) for entry in entries),
+        (_SITEMAP_TAIL,),
+    ), fsync)
+
+
+# ── Sitemap global ────────────────────────────────────────────────────────────
 
-    sitemap = '<?xml version="1.0" encoding="UTF-8"?>\n'
-    sitemap += '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"\n'
-    sitemap += '        xmlns:news="http://www.google.com/schemas/sitemap-news/0.9">\n'
-    sitemap += "\n".join(news_entries)
-    sitemap += "\n</urlset>\n"
+_SITEMAP_HEAD = '<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+_SITEMAP_TAIL = "</urlset>\n"
+# URL du site échappée pour XML une fois pour toutes (les dates n'ont rien à échapper)
+_XML_SITE_URL = xml_escape(SITE_URL)
+# Une entrée <url> : loc, lastmod, changefreq, priority
+_URL_TPL = """  <url>
+    <loc>{}</loc>
+    <lastmod>{}</lastmod>
+    <changefreq>{}</changefreq>
+    <priority>{}</priority>
+  </url>
+"""
 
-    atomic_write(DOCS_DIR / "news-sitemap.xml", sitemap)
 
+def _archive_urls(base: str, archive_dir: Path, dates: list[str]) -> Iterator[str]:
+    """Une entrée par page d'archive HTML effectivement générée."""
+    # Gabarit spécialisé une fois par jeu (URL de base, fréquence, priorité
+    # figées) : seule la date reste à substituer
+    tpl = _URL_TPL.format(f"{base}/archive/{{0}}", "{0}", "never", "0.7")
+    # Un seul parcours du dossier plutôt qu'un exists() (stat) par date
+    with os.scandir(archive_dir) as it:
+        pages = {e.name for e in it if e.name.endswith(".html")}
+    for d_str in dates:
+        if d_str + ".html" in pages:
+            yield tpl.format(d_str)
 
-# ── Sitemap global ────────────────────────────────────────────────────────────
 
-def generate_global_sitemap(today: date) -> None:
-    """Génère docs/sitemap.xml — toutes les URLs de tous les jeux."""
+def _sitemap_urls(today_str: str) -> Iterator[str]:
     from games.cemantix import CEMANTIX_ARCHIVE
     from games.sutom import SUTOM_ARCHIVE
     from games.loto import LOTO_ARCHIVE
     from games.euromillions import EM_ARCHIVE
     from games.pedantix import PEDANTIX_ARCHIVE
 
-    today_str = today.isoformat()
-    urls = []
-
     # Hub
-    urls.append(f"""  <url>
-    <loc>{SITE_URL}/</loc>
-    <lastmod>{today_str}</lastmod>
-    <changefreq>daily</changefreq>
-    <priority>1.0</priority>
-  </url>""")
-
-    # ── Cémantix ──
-    urls.append(f"""  <url>
-    <loc>{SITE_URL}/cemantix/</loc>
-    <lastmod>{today_str}</lastmod>
-    <changefreq>daily</changefreq>
-    <priority>0.9</priority>
-  </url>""")
-
-    cemantix_dates = sorted(
-        [date.fromisoformat(f.stem) for f in CEMANTIX_ARCHIVE.glob("????-??-??.json")]
-        if CEMANTIX_ARCHIVE.exists() else [],
-        reverse=True,
-    )
-    if cemantix_dates:
-        urls.append(f"""  <url>
-    <loc>{SITE_URL}/cemantix/archive/</loc>
-    <lastmod>{cemantix_dates[0].isoformat()}</lastmod>
-    <changefreq>daily</changefreq>
-    <priority>0.8</priority>
-  </url>""")
-        for d in cemantix_dates:
-            d_str = d.isoformat()
-            if not (CEMANTIX_ARCHIVE / f"{d_str}.html").exists():
-                continue
-            urls.append(f"""  <url>
-    <loc>{SITE_URL}/cemantix/archive/{d_str}</loc>
-    <lastmod>{d_str}</lastmod>
-    <changefreq>never</changefreq>
-    <priority>0.7</priority>
-  </url>""")
-
-    # ── Sutom ──
-    urls.append(f"""  <url>
-    <loc>{SITE_URL}/sutom/</loc>
-    <lastmod>{today_str}</lastmod>
-    <changefreq>daily</changefreq>
-    <priority>0.9</priority>
-  </url>""")
-
-    sutom_dates = sorted(
-        [date.fromisoformat(f.stem) for f in SUTOM_ARCHIVE.glob("????-??-??.json")]
-        if SUTOM_ARCHIVE.exists() else [],
-        reverse=True,
-    )
-    if sutom_dates:
-        urls.append(f"""  <url>
-    <loc>{SITE_URL}/sutom/archive/</loc>
-    <lastmod>{sutom_dates[0].isoformat()}</lastmod>
-    <changefreq>daily</changefreq>
-    <priority>0.8</priority>
-  </url>""")
-        for d in sutom_dates:
-            d_str = d.isoformat()
-            if not (SUTOM_ARCHIVE / f"{d_str}.html").exists():
-                continue
-            urls.append(f"""  <url>
-    <loc>{SITE_URL}/sutom/archive/{d_str}</loc>
-    <lastmod>{d_str}</lastmod>
-    <changefreq>never</changefreq>
-    <priority>0.7</priority>
-  </url>""")
-
-    # ── Pédantix ──
-    urls.append(f"""  <url>
-    <loc>{SITE_URL}/pedantix/</loc>
-    <lastmod>{today_str}</lastmod>
-    <changefreq>daily</changefreq>
-    <priority>0.9</priority>
-  </url>""")
-
-    pedantix_dates = sorted(
-        [date.fromisoformat(f.stem) for f in PEDANTIX_ARCHIVE.glob("????-??-??.json")]
-        if PEDANTIX_ARCHIVE.exists() else [],
-        reverse=True,
-    )
-    if pedantix_dates:
-        urls.append(f"""  <url>
-    <loc>{SITE_URL}/pedantix/archive/</loc>
-    <lastmod>{pedantix_dates[0].isoformat()}</lastmod>
-    <changefreq>daily</changefreq>
-    <priority>0.8</priority>
-  </url>""")
-        for d in pedantix_dates:
-            d_str = d.isoformat()
-            if not (PEDANTIX_ARCHIVE / f"{d_str}.html").exists():
-                continue
-            urls.append(f"""  <url>
-    <loc>{SITE_URL}/pedantix/archive/{d_str}</loc>
-    <lastmod>{d_str}</lastmod>
-    <changefreq>never</changefreq>
-    <priority>0.7</priority>
-  </url>""")
-
-    # ── Loto ──
-    loto_dates = sorted(
-        [date.fromisoformat(f.stem) for f in LOTO_ARCHIVE.glob("????-??-??.json")]
-        if LOTO_ARCHIVE.exists() else [],
-        reverse=True,
-    )
-    loto_lastmod = loto_dates[0].isoformat() if loto_dates else today_str
-    urls.append(f"""  <url>
-    <loc>{SITE_URL}/loto/</loc>
-    <lastmod>{loto_lastmod}</lastmod>
-    <changefreq>daily</changefreq>
-    <priority>0.9</priority>
-  </url>""")
-
-    if loto_dates:
-        urls.append(f"""  <url>
-    <loc>{SITE_URL}/loto/simulateur/</loc>
-    <lastmod>{loto_dates[0].isoformat()}</lastmod>
-    <changefreq>weekly</changefreq>
-    <priority>0.85</priority>
-  </url>""")
-        urls.append(f"""  <url>
-    <loc>{SITE_URL}/loto/stats/</loc>
-    <lastmod>{loto_dates[0].isoformat()}</lastmod>
-    <changefreq>weekly</changefreq>
-    <priority>0.8</priority>
-  </url>""")
-        urls.append(f"""  <url>
-    <loc>{SITE_URL}/loto/archive/</loc>
-    <lastmod>{loto_dates[0].isoformat()}</lastmod>
-    <changefreq>weekly</changefreq>
-    <priority>0.8</priority>
-  </url>""")
-        for d in loto_dates:
-            d_str = d.isoformat()
-            if not (LOTO_ARCHIVE / f"{d_str}.html").exists():
-                continue
-            urls.append(f"""  <url>
-    <loc>{SITE_URL}/loto/archive/{d_str}</loc>
-    <lastmod>{d_str}</lastmod>
-    <changefreq>never</changefreq>
-    <priority>0.7</priority>
-  </url>""")
-
-    # ── EuroMillions ──
-    em_dates = sorted(
-        [date.fromisoformat(f.stem) for f in EM_ARCHIVE.glob("????-??-??.json")]
-        if EM_ARCHIVE.exists() else [],
-        reverse=True,
-    )
-    em_lastmod = em_dates[0].isoformat() if em_dates else today_str
-    urls.append(f"""  <url>
-    <loc>{SITE_URL}/euromillions/</loc>
-    <lastmod>{em_lastmod}</lastmod>
-    <changefreq>daily</changefreq>
-    <priority>0.9</priority>
-  </url>""")
-
-    if em_dates:
-        urls.append(f"""  <url>
-    <loc>{SITE_URL}/euromillions/simulateur/</loc>
-    <lastmod>{em_dates[0].isoformat()}</lastmod>
-    <changefreq>weekly</changefreq>
-    <priority>0.85</priority>
-  </url>""")
-        urls.append(f"""  <url>
-    <loc>{SITE_URL}/euromillions/stats/</loc>
-    <lastmod>{em_dates[0].isoformat()}</lastmod>
-    <changefreq>weekly</changefreq>
-    <priority>0.8</priority>
-  </url>""")
-        urls.append(f"""  <url>
-    <loc>{SITE_URL}/euromillions/archive/</loc>
-    <lastmod>{em_dates[0].isoformat()}</lastmod>
-    <changefreq>weekly</changefreq>
-    <priority>0.8</priority>
-  </url>""")
-        for d in em_dates:
-            d_str = d.isoformat()
-            if not (EM_ARCHIVE / f"{d_str}.html").exists():
-                continue
-            urls.append(f"""  <url>
-    <loc>{SITE_URL}/euromillions/archive/{d_str}</loc>
-    <lastmod>{d_str}</lastmod>
-    <changefreq>never</changefreq>
-    <priority>0.7</priority>
-  </url>""")
-
-    sitemap = '<?xml version="1.0" encoding="UTF-8"?>\n'
-    sitemap += '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
-    sitemap += "\n".join(urls)
-    sitemap += "\n</urlset>\n"
-
-    atomic_write(DOCS_DIR / "sitemap.xml", sitemap)
+    yield _URL_TPL.format(f"{_XML_SITE_URL}/", today_str, "daily", "1.0")
+
+    # ── Jeux quotidiens : Cémantix, Sutom, Pédantix ──
+    for slug, archive_dir in (
+        ("cemantix", CEMANTIX_ARCHIVE),
+        ("sutom", SUTOM_ARCHIVE),
+        ("pedantix", PEDANTIX_ARCHIVE),
+    ):
+        base = f"{_XML_SITE_URL}/{slug}"
+        yield _URL_TPL.format(f"{base}/", today_str, "daily", "0.9")
+        dates = archive_dates(archive_dir)
+        if dates:
+            yield _URL_TPL.format(f"{base}/archive/", dates[0], "daily", "0.8")
+            yield from _archive_urls(base, archive_dir, dates)
+
+    # ── Tirages : Loto, EuroMillions ──
+    for slug, archive_dir in (
+        ("loto", LOTO_ARCHIVE),
+        ("euromillions", EM_ARCHIVE),
+    ):
+        base = f"{_XML_SITE_URL}/{slug}"
+        dates = archive_dates(archive_dir)
+        lastmod = dates[0] if dates else today_str
+        yield _URL_TPL.format(f"{base}/", lastmod, "daily", "0.9")
+        if dates:
+            yield _URL_TPL.format(f"{base}/simulateur/", lastmod, "weekly", "0.85")
+            yield _URL_TPL.format(f"{base}/stats/", lastmod, "weekly", "0.8")
+            yield _URL_TPL.format(f"{base}/archive/", lastmod, "weekly", "0.8")
+            yield from _archive_urls(base, archive_dir, dates)
+
+
+def generate_global_sitemap(today: date, fsync: bool = True) -> None:
+    """Génère docs/sitemap.xml — toutes les URLs de tous les jeux."""
+    # Le sitemap ne dépend que du jour et du contenu des dossiers archive :
+    # tout ajout/suppression de fichier y change le mtime du dossier
+    mtimes = []
+    for game in _GAMES:
+        try:
+            mtimes.append((DOCS_DIR / game / "archive").stat().st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    key = page_key(code_key(__file__), today, mtimes)
+    if _up_to_date("sitemap.xml", key):
+        return
+
+    # Entrées produites et écrites au fil de l'eau (pas de liste intermédiaire)
+    atomic_write_iter(DOCS_DIR / "sitemap.xml", chain(
+        (_SITEMAP_HEAD,), _sitemap_urls(today.isoformat()), (_SITEMAP_TAIL,),
+    ), fsync)
+    _mark_done("sitemap.xml", key)
 
 
 # ── Main ──────────────────────────────────────────────────────────────────────
 
+_GAMES = ("cemantix", "sutom", "pedantix", "loto", "euromillions")
+# Jeux dont la solution change chaque jour (les tirages, eux, restent valables)
+_DAILY_GAMES = ("cemantix", "sutom", "pedantix")
+
+
+def _load_game_data(game: str, today: date) -> dict | None:
+    """Reprend docs/<jeu>/solution.json sans relancer le jeu.
+    Pour un jeu quotidien, None si ce n'est pas la solution du jour."""
+    try:
+        data = json_loads((DOCS_DIR / game / "solution.json").read_bytes())
+    except (OSError, ValueError):
+        return None
+    if game in _DAILY_GAMES and data.get("date") != today.isoformat():
+        return None
+    return data
+
+
+class _LineWriter:
+    """Sortie partagée entre threads : chaque ligne est écrite d'un seul bloc,
+    sans être coupée par les print() d'un autre thread."""
+
+    def __init__(self, out):
+        self._out = out
+        self._lock = threading.Lock()
+        self._pending = threading.local()  # début de ligne propre à chaque thread
+
+    def write(self, s: str) -> int:
+        *lines, rest = (getattr(self._pending, "s", "") + s).split("\n")
+        self._pending.s = rest
+        if lines:
+            with self._lock:
+                self._out.write("\n".join(lines) + "\n")
+        return len(s)
+
+    def flush(self) -> None:
+        self._out.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._out, name)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Générateur de site statique multi-jeux")
     parser.add_argument("--model", default=MODEL_PATH_DEFAULT,
                         help="Chemin vers le modèle word2vec .bin (pour Cémantix)")
     parser.add_argument("--puzzle", type=int, default=None,
                         help="Forcer un numéro de puzzle Cémantix (debug)")
+    parser.add_argument("--skip-cemantix", action="store_true",
+                        help="Ne pas relancer Cémantix (reprend docs/cemantix/solution.json du jour)")
+    only = parser.add_mutually_exclusive_group()
+    only.add_argument("--only-hub", action="store_true",
+                      help="Régénérer uniquement docs/index.html, sans relancer les jeux")
+    only.add_argument("--only-sitemap", action="store_true",
+                      help="Régénérer uniquement les sitemaps, sans relancer les jeux")
     args = parser.parse_args()
 
+    # Tous les fichiers du run (jeux, hub, sitemaps) sont rendus durables
+    # ensemble à la fin, plutôt qu'un fsync par fichier écrit
+    with fsync_barrier():
+        _run(args)
+
+
+def _run(args: argparse.Namespace) -> None:
     today = date.today()
     print(f"\n=== Site Generator — {today.isoformat()} ===\n")
 
-    # 1. Cémantix
-    print("─── Cémantix ───────────────────────────────────────────")
-    from games.cemantix import run as run_cemantix
-    cemantix_data = run_cemantix(today, args.model, args.puzzle)
+    # Reconstructions partielles : aucun module de jeu n'est lancé, les données
+    # viennent des solution.json déjà écrits
+    if args.only_hub or args.only_sitemap:
+        game_data_all = {game: _load_game_data(game, today) for game in _GAMES}
+        if args.only_hub:
+            print("Génération de docs/index.html (hub)…")
+            generate_hub_html(today, game_data_all)
+        else:
+            print("Génération de docs/sitemap.xml (global)…")
+            generate_global_sitemap(today)
+            print("Génération de docs/news-sitemap.xml (Google News)…")
+            generate_news_sitemap(today, game_data_all)
+        return
 
-    # 2. Sutom
-    print("\n─── Sutom ──────────────────────────────────────────────")
+    # 1-2. Cémantix et Sutom en parallèle : jeux indépendants, la récupération
+    # Cémantix (réseau, modèle) se recouvre avec celle de Sutom. Les logs des deux
+    # jeux s'alternent ligne par ligne (préfixées par le nom du jeu).
+    print("─── Cémantix + Sutom ───────────────────────────────────")
     from games.sutom import run as run_sutom
-    sutom_data = run_sutom(today)
+    with redirect_stdout(_LineWriter(sys.stdout)), ThreadPoolExecutor(max_workers=2) as pool:
+        if args.skip_cemantix:
+            f_cemantix = None
+        else:
+            from games.cemantix import run as run_cemantix
+            f_cemantix = pool.submit(run_cemantix, today, args.model, args.puzzle)
+        f_sutom = pool.submit(run_sutom, today)
+        cemantix_data = f_cemantix.result() if f_cemantix else _load_game_data("cemantix", today)
+        sutom_data = f_sutom.result()
 
     # 3. Loto
     print("\n─── Loto ───────────────────────────────────────────────")
@@ -719,11 +752,12 @@ def main():
     # 6. Hub page
     print("\n─── Hub ────────────────────────────────────────────────")
     print("Génération de docs/index.html (hub)…")
-    generate_hub_html(today, {
+    game_data_all = {
         "cemantix": cemantix_data, "sutom": sutom_data,
         "loto": loto_data, "euromillions": em_data,
         "pedantix": pedantix_data,
-    })
+    }
+    generate_hub_html(today, game_data_all)
 
     # 7. Sitemap global
     print("Génération de docs/sitemap.xml (global)…")
@@ -731,11 +765,6 @@ def main():
 
     # 8. Google News sitemap
     print("Génération de docs/news-sitemap.xml (Google News)…")
-    game_data_all = {
-        "cemantix": cemantix_data, "sutom": sutom_data,
-        "loto": loto_data, "euromillions": em_data,
-        "pedantix": pedantix_data,
-    }
     generate_news_sitemap(today, game_data_all)
 
     print(f"\n🎉 Site complet généré pour le {date_fr(today)}")
@@ -20,7 +20,7 @@ from datetime import date
 from pathlib import Path
 
 from bs4 import BeautifulSoup
-from core import _session, date_fr, atomic_write, DOCS_DIR
+from core import get_session, date_fr, atomic_write, DOCS_DIR
 
 
 # ── Loto (OpenDataSoft) ───────────────────────────────────────────────────────
@@ -43,7 +43,7 @@ def seed_loto(max_rows: int = 200) -> int:
         rows = min(batch, max_rows - start)
         url = f"{_LOTO_API_BASE}&rows={rows}&start={start}"
         try:
-            resp = _session.get(url, timeout=20)
+            resp = get_session().get(url, timeout=20)
             resp.raise_for_status()
         except Exception as e:
             print(f"  ⚠ Loto API erreur (start={start}) : {e}")
@@ -162,7 +162,7 @@ def seed_euromillions(max_rows: int = 200) -> int:
 
         print(f"  EuroMillions : scraping {url}…")
         try:
-            resp = _session.get(url, headers=_EM_HEADERS, timeout=20)
+            resp = get_session().get(url, headers=_EM_HEADERS, timeout=20)
             if resp.status_code == 404:
                 print(f"  EuroMillions : {year} → 404, fin de l'historique")
                 break